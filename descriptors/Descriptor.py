@@ -5,7 +5,18 @@
 
 from __future__ import print_function, unicode_literals, division
 
+import math
 import sys
+import threading
+from collections import OrderedDict, namedtuple
+from itertools import count, groupby
+
+from descriptors import arrays
+
+# Functions called with every descriptor class created, used by
+# descriptors.profiling to instrument classes created while it is
+# enabled
+class_hooks = []
 
 
 def with_metaclass(meta, *bases):
@@ -31,26 +42,205 @@ class DescriptorMeta(type):
     we create. This can be disabled by creating a "no_autoset" class
     attribute in the derived class.
 
+    Instead of wrapping each __set__() so that it calls the __set__()
+    of its parent class at assignment time, the checks of all
+    autoset classes in the MRO are collected once at class creation
+    and compiled into a single setter that runs them in order and then
+    stores the value in the instance dict.
+
+    Each class also gets a validate() method that runs the same checks
+    without storing anything and returns the value to store. Classes
+    that convert values instead of only checking them define
+    validate() instead of __set__(), and get a setter that stores the
+    result.
+
     """
     def __new__(cls, clsname, bases, clsdict):
         clsobj = super(DescriptorMeta, cls).__new__(
             cls, clsname, bases, clsdict)
+        providers = [
+            c for c in clsobj.__mro__[1:] if "validate" in c.__dict__]
+        if not providers:
+            # the root of the hierarchy, its __set__ does the storing
+            clsobj._set_checks = ()
+            clsobj._set_convert = None
+            return clsobj
+        if "inline" not in clsdict and (
+                "__set__" in clsdict or "validate" in clsdict):
+            clsobj.inline = None  # the inherited expression is outdated
         if "no_autoset" in clsdict:
+            if "__set__" in clsdict and "validate" not in clsdict:
+                clsobj.validate = cls.compile_readback(clsdict["__set__"])
             return clsobj
-        if hasattr(clsobj, "__set__"):
-            setter = getattr(clsobj, "__set__")
-            new_setter = cls.add_super__set__(clsobj, setter)
-            setattr(clsobj, "__set__", new_setter)
+        if "__set__" in clsdict:
+            parent = providers[0]
+            checks = (clsdict["__set__"], )
+            if "_set_checks" in parent.__dict__:
+                checks += parent._set_checks
+                convert = parent._set_convert
+            else:  # parent converts the value, let it do so last
+                convert = parent.validate
+            clsobj._set_checks = checks
+            clsobj._set_convert = convert
+            clsobj.validate = cls.compile_validate(checks, convert)
+            clsobj.__set__ = cls.compile_setter(checks, convert)
+        elif "validate" in clsdict:
+            clsobj.__set__ = cls.compile_setter((), clsdict["validate"])
         return clsobj
 
-    def add_super__set__(clsobj, func):
-        def wrapper(*args, **kwargs):
-            func(*args, **kwargs)
-            next_cls = clsobj.__mro__[1]
-            if hasattr(next_cls, "__set__"):
-                super_setter = getattr(next_cls, "__set__")
-                super_setter(*args, **kwargs)
-        return wrapper
+    def __init__(cls, clsname, bases, clsdict):
+        super(DescriptorMeta, cls).__init__(clsname, bases, clsdict)
+        for hook in class_hooks:
+            hook(cls)
+
+    @staticmethod
+    def compile_validate(checks, convert=None):
+        """Return a validate method that calls all functions in checks
+        and then returns the value, or, if convert is given, the value
+        returned by convert.
+
+        """
+        if convert is not None:
+            def validate(self, instance, value):
+                for check in checks:
+                    check(self, instance, value, None)
+                return convert(self, instance, value)
+        elif len(checks) == 1:
+            check = checks[0]
+
+            def validate(self, instance, value):
+                check(self, instance, value, None)
+                return value
+        else:
+            def validate(self, instance, value):
+                for check in checks:
+                    check(self, instance, value, None)
+                return value
+        return validate
+
+    @staticmethod
+    def compile_setter(checks, convert=None):
+        """Return a setter that calls all functions in checks and
+        then stores the value in the instance dict. If convert is
+        given, the value returned by convert is stored instead.
+
+        The setter never modifies the descriptor, so one descriptor can
+        be used from any number of threads without locking. The name
+        argument is only accepted for compatibility with setters of
+        composed descriptors from older versions.
+
+        """
+        if convert is not None:
+            def setter(self, instance, value, name=None):
+                for check in checks:
+                    check(self, instance, value, name)
+                value = convert(self, instance, value)
+                instance.__dict__[name or self.name] = value
+        elif len(checks) == 1:
+            check = checks[0]
+
+            def setter(self, instance, value, name=None):
+                check(self, instance, value, name)
+                instance.__dict__[name or self.name] = value
+        else:
+            def setter(self, instance, value, name=None):
+                for check in checks:
+                    check(self, instance, value, name)
+                instance.__dict__[name or self.name] = value
+        setter.__name__ = str("__set__")
+        return setter
+
+    @staticmethod
+    def compile_readback(setter):
+        """Return a validate method for a no_autoset class that only
+        defines __set__: let the setter store the value and read the
+        stored value back.
+
+        """
+        def validate(self, instance, value):
+            setter(self, instance, value)
+            return instance.__dict__[self.name]
+        return validate
+
+
+class ValidationError(ValueError):
+    """The exception raised when a value does not satisfy the condition
+    of a Descriptor. It stores the descriptor, the class of the
+    instance, the name of the attribute and the offending value, and
+    only renders its message when converted to a string, so failing a
+    check is cheap even for values with an expensive repr.
+
+    """
+    def __init__(self, descriptor, instance, value):
+        super(ValidationError, self).__init__()
+        self.descriptor = descriptor
+        self.instance_cls = instance.__class__
+        self.name = getattr(descriptor, "name", None)
+        self.value = value
+
+    def __str__(self):
+        if self.name is None:
+            # the message will be created by the composed descriptor
+            return ""
+        return (
+            "Attempted to set the {f_type} attribute {inst}.{attr} to the "
+            "{val_type} value {val}, which does not satisfy the condition "
+            "{f_type}.".format(
+                f_type=self.descriptor.field_type,
+                inst=self.instance_cls.__name__,
+                attr=self.name,
+                val_type=self.value.__class__.__name__,
+                val=self.value))
+
+    def __repr__(self):
+        # the value isn't formatted, like in the message, but unlike
+        # the message, the repr is often created for logging
+        attr = self.instance_cls.__name__
+        if self.name is not None:
+            attr += "." + self.name
+        return "<{}: {} attribute {}, {} value>".format(
+            self.__class__.__name__, self.descriptor.field_type, attr,
+            self.value.__class__.__name__)
+
+    def __reduce__(self):
+        state = dict(self.__dict__)
+        fields = getattr(self.instance_cls, "_fields", {})
+        if fields.get(self.name) is self.descriptor:
+            # the descriptor is looked up again when unpickling, so
+            # fields with unpicklable arguments, e.g. lambdas, still
+            # produce picklable errors
+            state["descriptor"] = None
+        return (restore_error, (self.__class__, state))
+
+
+def restore_error(cls, state):
+    """Recreate a ValidationError pickled by its __reduce__ method."""
+    error = cls.__new__(cls)
+    if state["descriptor"] is None:
+        state["descriptor"] = state["instance_cls"]._fields[state["name"]]
+    error.__dict__.update(state)
+    return error
+
+
+class ValidationErrors(ValueError):
+    """The exception raised when validating several attributes at
+    once, e.g. with Validated.from_dict(), fails. The ValidationError
+    of every attribute that failed is stored in errors.
+
+    """
+    def __init__(self, errors):
+        super(ValidationErrors, self).__init__()
+        self.errors = errors
+
+    def __str__(self):
+        return "\n".join(str(e) for e in self.errors)
+
+    def __repr__(self):
+        return "<{}: {}>".format(
+            self.__class__.__name__, ", ".join(repr(e) for e in self.errors))
+
+    def __reduce__(self):
+        return (self.__class__, (self.errors, ))
 
 
 class Descriptor(with_metaclass(DescriptorMeta, object)):
@@ -62,41 +252,108 @@ class Descriptor(with_metaclass(DescriptorMeta, object)):
         self.field_type = self.__class__.__name__
 
     def __set__(self, instance, value, name=None):
-        if name is None:
-            name = self.name
-        else:  # __set__ was originally called by a composed descriptor
-            self.name = name
-        instance.__dict__[name] = value
+        instance.__dict__[name or self.name] = value
 
     def __get__(self, instance, cls):
+        if instance is None:
+            return self
         try:
             return instance.__dict__[self.name]
         except KeyError:
-            raise AttributeError
+            raise AttributeError(self.name)
 
     def __delete__(self, instance):
         del instance.__dict__[self.name]
 
+    def validate(self, instance, value):
+        """Return the value to store if value satisfies this descriptor,
+        or raise a ValidationError otherwise. Unlike __set__(), this
+        doesn't store anything.
+
+        """
+        return value
+
+    def bind(self, name):
+        """Bind this descriptor to the attribute called name. This is
+        done once, when the Validated class is created, after which
+        the descriptor isn't modified anymore.
+
+        """
+        self.name = name
+
+    def store_in_slot(self, slot):
+        """Store the value of the described attribute using slot, the
+        member descriptor created for an entry of __slots__, instead of
+        storing it in the instance dict.
+
+        """
+        self.slot = slot
+        self.__class__ = slot_variant(self.__class__)
+
+    # True if validate() blocks on I/O, so that asynchronous validation
+    # runs it in an executor
+    blocking = False
+
+    # True if array_mask() is vectorized instead of element by element
+    vectorized = False
+
+    # False if the result of validate() depends on more than the value,
+    # like the other attributes of the instance or the file system, so
+    # that set_sampling() doesn't cache it
+    pure = True
+
+    # True if validate() may return another value than the one it was
+    # given, like Apply, so that set_sampling() doesn't sample it
+    converting = False
+
+    # Descriptors whose check can be written as a Python expression
+    # define an inline(self, x, const) method returning an expression
+    # that is true if the value of the variable x satisfies the
+    # descriptor, calling const(obj) for a name or literal to refer to
+    # the objects it needs. Validated classes with compile_schema
+    # compile these into one function. Subclasses that change __set__
+    # or validate lose the inline method of their parent.
+    inline = None
+
+    def validate_array(self, values, indices=False):
+        """Validate all elements of the NumPy array (or array-like)
+        values at once. Return a boolean mask that is True for each
+        element that satisfies this descriptor, or, if indices is True,
+        the indices of the elements that don't.
+
+        Example:
+            InRange(1, 4).validate_array([0, 2, 5])
+            -> array([False, True, False])
+
+            InRange(1, 4).validate_array([0, 2, 5], indices=True)
+            -> array([0, 2])
+
+        """
+        mask = self.array_mask(arrays.asarray(values))
+        if indices:
+            return arrays.invalid_indices(mask)
+        return mask
+
+    def array_mask(self, array):
+        """Return a boolean mask for validate_array(). Descriptors
+        that can check a whole array at once override this, the
+        default checks element by element.
+
+        """
+        return arrays.elementwise(self.validate, array)
+
     def __repr__(self):
         return "<Descriptor: {} at {}>".format(self.field_type, hex(id(self)))
 
     def err_msg(self, instance, value):
         """Return an error message for use in exceptions thrown by
-        subclasses.
+        subclasses. Subclasses should prefer raising a ValidationError,
+        which creates this message only when needed and is the only
+        exception a disjunction of descriptors treats as a failed
+        check.
 
         """
-        if not hasattr(self, "name"):
-            # err_msg will be called by the composed descriptor
-            return ""
-        return (
-            "Attempted to set the {f_type} attribute {inst}.{attr} to the "
-            "{val_type} value {val}, which does not satisfy the condition "
-            "{f_type}.".format(
-                f_type=self.field_type,
-                inst=instance.__class__.__name__,
-                attr=self.name,
-                val_type=value.__class__.__name__,
-                val=value))
+        return str(ValidationError(self, instance, value))
 
     @staticmethod
     def assert_descriptor(obj):
@@ -105,38 +362,13 @@ class Descriptor(with_metaclass(DescriptorMeta, object)):
             raise TypeError(
                 "Cannot combine with a non-Descriptor instance.")
 
-    @staticmethod
-    def __create_new(field_type, set_func):
-        clsdict = {"__set__": set_func, "no_autoset": True}
-        new_desc = type(str(field_type), (Descriptor, ), clsdict)()
-        new_desc.field_type = field_type
-        return new_desc
-
     def __and__(self, other):
         """Create a conjunction of this descriptor and another
         descriptor.
 
         """
         Descriptor.assert_descriptor(other)
-        setter1 = self.__class__.__set__
-        setter2 = other.__class__.__set__
-
-        def new_set(new_self, instance, value, name=None):
-            if name:
-                new_self.name = name
-            try:
-                setter1(self, instance, value, name=new_self.name)
-                value = getattr(instance, new_self.name)
-                setter2(other, instance, value, name=new_self.name)
-                value = getattr(instance, new_self.name)
-                super(new_self.__class__, new_self).__set__(
-                    instance, value, name)
-            except ValueError:
-                raise ValueError(new_self.err_msg(instance, value))
-
-        new_field_type = self.field_type + "_AND_" + other.field_type
-        new_desc = Descriptor.__create_new(new_field_type, new_set)
-        return new_desc
+        return All(All.flatten(self) + All.flatten(other))
 
     def __or__(self, other):
         """Create a disjunction of this descriptor and another
@@ -144,28 +376,21 @@ class Descriptor(with_metaclass(DescriptorMeta, object)):
 
         """
         Descriptor.assert_descriptor(other)
-        setter1 = self.__class__.__set__
-        setter2 = other.__class__.__set__
-
-        def new_set(new_self, instance, value, name=None):
-            if name:
-                new_self.name = name
-            exceptions = 0
-            for setter, caller in zip((setter1, setter2), (self, other)):
-                try:
-                    setter(caller, instance, value, name=new_self.name)
-                    return  # one descriptor satisfied
-                except ValueError as e:  # Descriptors throw ValueErrors
-                    if Descriptor.exc_thrown_by_descriptor():
-                        exceptions += 1
-                    else:
-                        raise e
-            if exceptions >= 2:
-                raise ValueError(new_self.err_msg(instance, value))
-
-        new_field_type = self.field_type + "_OR_" + other.field_type
-        new_desc = Descriptor.__create_new(new_field_type, new_set)
-        return new_desc
+        return Any(Any.flatten(self) + Any.flatten(other))
+
+    def memoize(self, maxsize=1024):
+        """Return a Memoized descriptor that caches the results of this
+        descriptor for up to maxsize distinct values.
+
+        """
+        return Memoized(self, maxsize)
+
+    def sample(self, fraction):
+        """Return a Sampled descriptor that only checks the given
+        fraction of the values assigned with this descriptor.
+
+        """
+        return Sampled(self, fraction)
 
     @staticmethod
     def exc_thrown_by_descriptor():
@@ -173,12 +398,373 @@ class Descriptor(with_metaclass(DescriptorMeta, object)):
         Descriptor instance.
 
         """
-        traceback = sys.exc_info()[2]
-        tb_locals = traceback.tb_frame.f_locals
-        # relying on naming convention to get the object that threw
-        # the exception
-        if "self" in tb_locals:
-            if not isinstance(tb_locals["self"], Descriptor):
-                return False
-            return True
-        return False
+        return isinstance(sys.exc_info()[1], ValidationError)
+
+
+_slot_variants = {}
+
+
+def slot_variant(cls):
+    """Return a subclass of the descriptor class cls that stores values
+    in the slot given to Descriptor.store_in_slot() instead of the
+    instance dict.
+
+    """
+    try:
+        return _slot_variants[cls]
+    except KeyError:
+        pass
+    validate = cls.validate
+
+    def __set__(self, instance, value, name=None):
+        self.slot.__set__(instance, validate(self, instance, value))
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        try:
+            return self.slot.__get__(instance, owner)
+        except AttributeError:  # name the field, not the slot
+            raise AttributeError(self.name)
+
+    def __delete__(self, instance):
+        try:
+            self.slot.__delete__(instance)
+        except AttributeError:
+            raise AttributeError(self.name)
+
+    def __reduce__(self):
+        # the variant can't be looked up by name, so pickle an instance
+        # of cls and turn it into the variant again when unpickling
+        state = self.__dict__
+        if hasattr(cls, "__setstate__"):  # e.g. All drops its closures
+            state = self.__getstate__()
+        return (restore_slot_variant, (cls, state))
+
+    clsdict = {"no_autoset": True, "__doc__": cls.__doc__}
+    variant = type(cls)(str(cls.__name__), (cls, ), clsdict)
+    variant.__set__ = __set__
+    variant.__get__ = __get__
+    variant.__delete__ = __delete__
+    variant.__reduce__ = __reduce__
+    for hook in class_hooks:  # __set__ was replaced after creation
+        hook(variant)
+    return _slot_variants.setdefault(cls, variant)
+
+
+def restore_slot_variant(cls, state):
+    """Recreate a descriptor pickled by the __reduce__ method of a
+    slot variant of cls.
+
+    """
+    desc = cls.__new__(cls)
+    if hasattr(cls, "__setstate__"):
+        desc.__setstate__(state)
+    else:
+        desc.__dict__.update(state)
+    desc.__class__ = slot_variant(cls)
+    return desc
+
+
+class All(Descriptor):
+    """A descriptor that only allows values satisfying all of the given
+    descriptors. The value is passed from one descriptor to the next,
+    so converting descriptors like Apply affect the value seen by the
+    following ones, and is stored once at the end.
+
+    Descriptors combined with & create an All descriptor, e.g.
+    Int() & Positive() & LessThan(10) is equivalent to
+    All([Int(), Positive(), LessThan(10)]).
+
+    Adjacent descriptors of a class that defines a combine_all
+    classmethod, like NotRegexMatch, are checked by the single
+    function it returns for all of them.
+
+    """
+    joiner = "_AND_"
+    combiner = "combine_all"
+
+    def __init__(self, descriptors):
+        super(All, self).__init__()
+        for desc in descriptors:
+            Descriptor.assert_descriptor(desc)
+        self.descriptors = tuple(descriptors)
+        self.field_type = self.joiner.join(
+            desc.field_type for desc in self.descriptors)
+        self.validators = self.combine_validators()
+        self.vectorized = all(desc.vectorized for desc in self.descriptors)
+        self.pure = all(desc.pure for desc in self.descriptors)
+        self.converting = any(desc.converting for desc in self.descriptors)
+
+    def combine_validators(self):
+        """Return the validate functions applied in turn by this
+        descriptor, combining runs of descriptors of the same class
+        if the class supports it.
+
+        """
+        validators = []
+        for cls, group in groupby(self.descriptors, self.combinable):
+            group = list(group)
+            if cls is None or len(group) == 1:
+                validators.extend(desc.validate for desc in group)
+            else:
+                validators.append(getattr(cls, self.combiner)(group))
+        return tuple(validators)
+
+    def combinable(self, desc):
+        cls = desc.__class__
+        return cls if self.combiner in cls.__dict__ else None
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        del state["validators"]  # combined validators may be closures
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.validators = self.combine_validators()
+
+    @classmethod
+    def flatten(cls, desc):
+        """Return the descriptors combined by desc if it is an
+        instance of exactly this class, otherwise just desc.
+
+        """
+        if desc.__class__ is cls:
+            return desc.descriptors
+        return (desc, )
+
+    def bind(self, name):
+        super(All, self).bind(name)
+        for desc in self.descriptors:
+            desc.bind(name)
+
+    def array_mask(self, array):
+        if not self.vectorized:
+            return super(All, self).array_mask(array)
+        mask = self.descriptors[0].array_mask(array)
+        for desc in self.descriptors[1:]:
+            mask = mask & desc.array_mask(array)
+        return mask
+
+    def inline(self, x, const):
+        return self.inline_joined(x, const, " and ")
+
+    def inline_joined(self, x, const, operator):
+        exprs = []
+        for desc in self.descriptors:
+            expr = desc.inline and desc.inline(x, const)
+            if not expr:
+                return None
+            exprs.append(expr)
+        return "(" + operator.join(exprs) + ")"
+
+    def validate(self, instance, value):
+        result = value
+        try:
+            for validate in self.validators:
+                result = validate(instance, result)
+        except ValidationError:
+            raise ValidationError(self, instance, value)
+        return result
+
+
+class Any(All):
+    """A descriptor that only allows values satisfying at least one of
+    the given descriptors. The value returned by the first satisfied
+    descriptor is stored.
+
+    Descriptors combined with | create an Any descriptor, e.g.
+    Tuple() | List() | Set() is equivalent to
+    Any([Tuple(), List(), Set()]).
+
+    Adjacent descriptors of a class that defines a combine_any
+    classmethod, like RegexMatch, are checked by the single function
+    it returns for all of them.
+
+    """
+    joiner = "_OR_"
+    combiner = "combine_any"
+
+    def array_mask(self, array):
+        if not self.vectorized:
+            return super(All, self).array_mask(array)
+        mask = self.descriptors[0].array_mask(array)
+        for desc in self.descriptors[1:]:
+            mask = mask | desc.array_mask(array)
+        return mask
+
+    def inline(self, x, const):
+        return self.inline_joined(x, const, " or ")
+
+    def validate(self, instance, value):
+        for validate in self.validators:
+            try:
+                return validate(instance, value)
+            except ValidationError:  # raised only by descriptors
+                pass
+        raise ValidationError(self, instance, value)
+
+
+CacheInfo = namedtuple(
+    "CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"])
+
+_rejected = object()
+
+
+class Memoized(Descriptor):
+    """A descriptor that remembers whether values satisfied another,
+    pure descriptor, i.e. one whose result only depends on the value.
+    The results for the maxsize most recently used hashable values are
+    cached, keyed by the class and the value, and the values returned
+    by converting descriptors like Apply are cached too. Values that
+    aren't hashable are always checked.
+
+    This pays off for expensive checks of values that repeat a lot,
+    like categorical strings:
+
+        class Event(Validated):
+            country = (Str() & Satisfies(lookup_country)).memoize()
+
+    Converted values are shared by all instances they are assigned to,
+    so the function of a memoized Apply should return immutable
+    values. cache_info() returns the hits, misses and evictions of the
+    cache.
+
+    """
+    def __init__(self, descriptor, maxsize=1024):
+        super(Memoized, self).__init__()
+        Descriptor.assert_descriptor(descriptor)
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+        self.descriptor = descriptor
+        self.maxsize = maxsize
+        self.field_type = descriptor.field_type
+        self.blocking = descriptor.blocking
+        self.vectorized = descriptor.vectorized
+        self.pure = descriptor.pure
+        self.converting = descriptor.converting
+        self.cache_clear()
+
+    def cache_clear(self):
+        """Forget all cached results and reset the statistics."""
+        self.cache = OrderedDict()  # (class, value) -> result
+        self.lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def cache_info(self):
+        """Return the statistics of the cache as a CacheInfo."""
+        return CacheInfo(
+            self.hits, self.misses, self.evictions, self.maxsize,
+            len(self.cache))
+
+    def bind(self, name):
+        super(Memoized, self).bind(name)
+        self.descriptor.bind(name)
+
+    def array_mask(self, array):
+        return self.descriptor.array_mask(array)
+
+    def validate(self, instance, value):
+        key = (value.__class__, value)
+        try:
+            with self.lock:
+                result = self.cache.pop(key)
+                self.cache[key] = result
+                self.hits += 1
+        except KeyError:
+            result = self.remember(instance, value, key)
+        except TypeError:  # unhashable
+            return self.descriptor.validate(instance, value)
+        if result is _rejected:
+            raise ValidationError(self, instance, value)
+        return result
+
+    def remember(self, instance, value, key):
+        try:
+            result = self.descriptor.validate(instance, value)
+        except ValidationError:
+            result = _rejected
+        with self.lock:
+            self.misses += 1
+            self.cache[key] = result
+            if len(self.cache) > self.maxsize:
+                self.cache.popitem(last=False)
+                self.evictions += 1
+        return result
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        for attr in ("cache", "lock", "hits", "misses", "evictions"):
+            del state[attr]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.cache_clear()
+
+
+class Sampled(Descriptor):
+    """A descriptor that only checks a fraction of the values assigned
+    to it with another descriptor and lets the others through
+    unchecked, for attributes on hot paths whose values are trusted.
+    The checked values are spread evenly over the assignments, e.g.
+    every tenth for a fraction of 0.1, and with a fraction of 0 the
+    attribute is a plain attribute.
+
+    Values that aren't checked aren't converted either, so descriptors
+    like Apply shouldn't be sampled, and Validated.set_sampling()
+    refuses to.
+
+    """
+    def __init__(self, descriptor, fraction):
+        super(Sampled, self).__init__()
+        Descriptor.assert_descriptor(descriptor)
+        if not 0 <= fraction <= 1:
+            raise ValueError("fraction must be between 0 and 1.")
+        self.descriptor = descriptor
+        self.fraction = fraction
+        # the credit is counted in integer units, since adding up
+        # floats like 0.1 would fall short of a whole check, and
+        # rounded up, so rather too many values are checked than too
+        # few
+        self.step = int(math.ceil(fraction * Sampled.unit))
+        self.assignments = count(1)
+        self.field_type = descriptor.field_type
+        self.blocking = descriptor.blocking
+        self.vectorized = descriptor.vectorized
+        self.pure = descriptor.pure
+        self.converting = descriptor.converting
+
+    def bind(self, name):
+        super(Sampled, self).bind(name)
+        self.descriptor.bind(name)
+
+    def array_mask(self, array):
+        return self.descriptor.array_mask(array)
+
+    unit = 1 << 30
+
+    def sampled(self):
+        """Return True if the value of the current assignment is to be
+        checked, i.e. if the credit of all assignments so far reaches
+        another whole check. The assignments are numbered by an
+        itertools.count, which is thread-safe and keeps the descriptor
+        itself unchanged.
+
+        """
+        return next(self.assignments) * self.step % Sampled.unit < self.step
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        del state["assignments"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.assignments = count(1)
+
+    def validate(self, instance, value):
+        if self.sampled():
+            return self.descriptor.validate(instance, value)
+        return value
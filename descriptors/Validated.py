@@ -1,18 +1,391 @@
 # descriptors.Validated
 #
-# Implements the Validated metaclass, from which classes using
+# Implements the Validated base class, from which classes using
 # attributes validated by a Descriptor should inherit.
 
 from __future__ import print_function, unicode_literals, division
 
+import copy
 from collections import OrderedDict
+from itertools import chain
+
+from six.moves import copyreg
 
 from descriptors import Descriptor
+from descriptors.codegen import compile_from_dict
+from descriptors.Descriptor import (
+    Sampled, ValidationError, ValidationErrors, with_metaclass)
 from descriptors.utils.Prepareable import Prepareable
+from descriptors.utils.parallel import (
+    chunked, ordered_map, process_pool, thread_pool)
+
+
+class ValidatedMeta(Prepareable):
+    """Metaclass of Validated. When a Validated subclass is created,
+    go through its class dict, collect all Descriptor instances, and
+    bind those descriptors to their attribute names. This happens once
+    per class, so instantiating a Validated subclass costs the same as
+    instantiating any other class.
+
+    The collected descriptors are stored in definition order, including
+    those inherited from Validated base classes, in the _fields class
+    attribute, and their names and validate methods in _validators.
+
+    If a class has a True-y "use_slots" attribute, its own descriptors
+    store their values in slots generated for them, and if all its
+    base classes use slots as well, its instances have no __dict__.
+
+    If a class has a True-y "fast_reads" attribute, its descriptors are
+    removed from the class dict, so reading an attribute is a plain
+    instance dict lookup, and assignments are validated by a generated
+    __setattr__() instead. The descriptors can still be accessed on the
+    class.
+
+    If a class has a True-y "compile_schema" attribute, the checks of
+    all its fields are compiled into one function used by from_dict()
+    and the other methods validating whole mappings, see
+    descriptors.codegen.
+
+    """
+
+    def __prepare__(cls, bases, *args, **kwargs):
+        return OrderedDict()
+
+    def __new__(cls, clsname, bases, clsdict):
+        own_fields = [
+            name for name, value in clsdict.items()
+            if isinstance(value, Descriptor)]
+        use_slots = clsdict.get("use_slots", any(
+            getattr(base, "use_slots", False) for base in bases))
+        fast_reads = clsdict.get("fast_reads", any(
+            getattr(base, "fast_reads", False) for base in bases))
+        if use_slots and fast_reads:
+            raise TypeError(
+                "A Validated class can't use both use_slots and fast_reads.")
+        if fast_reads and "__setattr__" in clsdict:
+            raise TypeError(
+                "A Validated class using fast_reads can't define "
+                "__setattr__.")
+        clsdict = dict(clsdict)
+        if fast_reads:
+            hidden = dict((name, clsdict.pop(name)) for name in own_fields)
+        if use_slots:
+            clsdict["__slots__"] = tuple(clsdict.get("__slots__", ())) + \
+                tuple(ValidatedMeta.slot_name(name) for name in own_fields)
+        clsobj = super(ValidatedMeta, cls).__new__(
+            cls, clsname, bases, clsdict)
+        fields = OrderedDict()
+        for base in reversed(bases):
+            fields.update(getattr(base, "_fields", {}))
+        if fast_reads:
+            clsdict.update(hidden)
+        for name, value in clsdict.items():
+            if name in own_fields:
+                if use_slots:
+                    # store_in_slot() changes the descriptor, which may
+                    # be used by other classes as well
+                    value = copy.copy(value)
+                    setattr(clsobj, name, value)
+                value.bind(name)
+                if use_slots:
+                    value.store_in_slot(
+                        clsobj.__dict__[ValidatedMeta.slot_name(name)])
+                fields[name] = value
+            elif name in fields:  # descriptor overridden by a subclass
+                del fields[name]
+        clsobj._fields = fields
+        ValidatedMeta.compile_fields(clsobj)
+        if not getattr(clsobj, "compile_schema", False) and \
+                "_from_dict" not in clsdict and any(
+                    isinstance(base.__dict__.get("_from_dict"), staticmethod)
+                    for base in clsobj.__mro__[1:]):
+            # don't use the function compiled for a base class
+            clsobj._from_dict = Validated.__dict__["_from_dict"]
+        if ValidatedMeta.disabled is not None:
+            ValidatedMeta.disable(clsobj)
+        return clsobj
+
+    @staticmethod
+    def compile_fields(clsobj):
+        """Create the attributes of clsobj that are derived from its
+        _fields: _validators, the __setattr__() of a class using
+        fast_reads and the _from_dict() of a class using
+        compile_schema.
+
+        """
+        clsobj._validators = tuple(
+            (name, desc.validate, getattr(desc, "slot", None))
+            for name, desc in clsobj._fields.items())
+        if getattr(clsobj, "fast_reads", False):
+            clsobj.__setattr__ = ValidatedMeta.fast_setattr(clsobj)
+        if getattr(clsobj, "compile_schema", False):
+            clsobj._from_dict = staticmethod(compile_from_dict(clsobj))
+
+    @staticmethod
+    def replace_fields(clsobj, replacements):
+        """Make the class clsobj use the descriptors in the dict
+        replacements for the fields of the same names, in place of the
+        descriptors it was created with. The descriptors of the base
+        classes aren't changed.
+
+        """
+        for name, desc in replacements.items():
+            slot = getattr(clsobj._fields[name], "slot", None)
+            desc.bind(name)
+            if slot is not None and getattr(desc, "slot", None) is None:
+                desc.store_in_slot(slot)
+            inherited = [
+                c.__dict__[name] for c in clsobj.__mro__[1:]
+                if name in c.__dict__]
+            if inherited and inherited[0] is desc:
+                if name in clsobj.__dict__:
+                    delattr(clsobj, name)
+            elif inherited or name in clsobj.__dict__:
+                # otherwise the descriptor is hidden by fast_reads
+                setattr(clsobj, name, desc)
+        fields = OrderedDict(clsobj._fields)
+        fields.update(replacements)
+        clsobj._fields = fields
+        ValidatedMeta.compile_fields(clsobj)
+
+    @staticmethod
+    def unsampled(clsobj, name):
+        """Return the descriptor of the field called name of clsobj
+        before a base class it inherits the field from changed its
+        sampling, see Validated.set_sampling().
+
+        """
+        desc = clsobj._fields[name]
+        for base in clsobj.__mro__[1:]:
+            originals = base.__dict__.get("_unsampled", {})
+            if name in originals and base._fields.get(name) is desc:
+                return originals[name]
+        return desc
+
+    # maps the Validated classes to their fields while validation is
+    # disabled by disable_validation(), None otherwise
+    disabled = None
+
+    @staticmethod
+    def disable(clsobj):
+        """Replace the fields of clsobj by plain attributes, and
+        remember them for enable_validation().
+
+        """
+        # fields inherited from a disabled class are disabled already
+        fields = OrderedDict(
+            (name, getattr(desc, "enabled", desc))
+            for name, desc in clsobj._fields.items())
+        ValidatedMeta.disabled[clsobj] = fields
+        replacements = {}
+        for name, desc in fields.items():
+            replacements[name] = Sampled(desc, 0)
+            replacements[name].enabled = desc
+        ValidatedMeta.replace_fields(clsobj, replacements)
+        # the methods validating mappings use the Sampled descriptors,
+        # but assignments don't call any Python code
+        for name, desc in replacements.items():
+            if name in clsobj.__dict__:
+                slot = getattr(desc, "slot", None)
+                setattr(clsobj, name, slot or Unchecked(desc.enabled))
+
+    def __getattr__(cls, name):
+        """Return the descriptor of a field that was removed from the
+        class dict because the class uses fast_reads.
+
+        """
+        try:
+            return cls.__dict__["_fields"][name]
+        except KeyError:
+            raise AttributeError(name)
+
+    @staticmethod
+    def fast_setattr(clsobj):
+        """Return a __setattr__ method for a class using fast_reads,
+        which validates the fields whose descriptors are not in the
+        class dict and stores them in the instance dict.
+
+        """
+        validators = dict(
+            (name, desc.validate) for name, desc in clsobj._fields.items()
+            if not any(name in c.__dict__ for c in clsobj.__mro__))
+        base_setattr = object.__setattr__
+
+        def __setattr__(self, name, value):
+            validate = validators.get(name)
+            if validate is None:
+                base_setattr(self, name, value)
+            else:
+                self.__dict__[name] = validate(self, value)
+        return __setattr__
+
+    @staticmethod
+    def slot_name(name):
+        """Return the name of the slot storing the field called name."""
+        return "_slot_" + name
+
+
+class Unchecked(object):
+    """Stands in for the descriptor of a field while validation is
+    disabled. It only defines __get__, so values are stored in and read
+    from the instance dict like those of plain attributes.
+
+    """
+    def __init__(self, descriptor):
+        self.descriptor = descriptor
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self.descriptor
+        raise AttributeError(self.descriptor.name)
+
+
+_missing = object()
+_batch_classes = {}
+
+
+def batch_class(cls):
+    """Return a subclass of the Validated class cls whose fields are
+    plain attributes. Instances of cls are turned into instances of it
+    while assignments are batched, see Validated.batch().
+
+    """
+    try:
+        return _batch_classes[cls]
+    except KeyError:
+        pass
+    clsdict = {
+        "__slots__": (), "__doc__": cls.__doc__, "__module__": cls.__module__,
+        "_batch_of": cls}
+    for name, desc in cls._fields.items():
+        slot = getattr(desc, "slot", None)
+        if slot is not None:
+            clsdict[name] = slot
+        elif any(name in c.__dict__ for c in cls.__mro__):
+            clsdict[name] = Unchecked(desc)
+    if getattr(cls, "fast_reads", False):
+        clsdict["__setattr__"] = object.__setattr__
+
+    def __reduce_ex__(self, protocol):
+        # the variant can't be looked up by name, so pickle and copy
+        # instances as instances of cls
+        reduced = super(variant, self).__reduce_ex__(protocol)
+        create = reduced[0]
+        if create is copyreg.__newobj__:  # pickle insists on the variant
+            create = new_instance
+        args = tuple(cls if arg is variant else arg for arg in reduced[1])
+        return (create, args) + tuple(reduced[2:])
+
+    clsdict["__reduce_ex__"] = __reduce_ex__
+    # type.__new__ instead of ValidatedMeta, which would bind the fields
+    variant = type.__new__(type(cls), str(cls.__name__), (cls, ), clsdict)
+    return _batch_classes.setdefault(cls, variant)
+
+
+def new_instance(cls, *args):
+    """Create an instance of cls when unpickling an instance of its
+    batch variant, like copyreg.__newobj__.
+
+    """
+    return cls.__new__(cls, *args)
+
+
+def slot_value(obj, slot):
+    try:
+        return slot.__get__(obj, obj.__class__)
+    except AttributeError:
+        return _missing
+
+
+class Batch(object):
+    """The context manager returned by Validated.batch()."""
+    def __init__(self, obj):
+        self.obj = obj
+        self.cls = obj.__class__
+        # a batch within a batch of the same object is part of it
+        self.nested = "_batch_of" in self.cls.__dict__
+
+    def __enter__(self):
+        if not self.nested:
+            self.saved = self.state()
+            self.obj.__class__ = batch_class(self.cls)
+        return self.obj
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.nested:
+            return False
+        self.obj.__class__ = self.cls
+        if exc_type is not None:
+            self.restore()
+            return False
+        try:
+            errors = self.validate()
+        except BaseException:  # e.g. a TypeError raised by a check
+            self.restore()
+            raise
+        if errors:
+            self.restore()
+            raise ValidationErrors(errors)
+        return False
 
+    def state(self):
+        """Return the instance dict and the values of the slots of the
+        fields of the object, to restore them if the batch fails.
 
-class Validated(Prepareable):
-    """By inheriting from this metaclass, classes can conveniently use
+        """
+        obj_dict = getattr(self.obj, "__dict__", None)
+        slots = dict(
+            (name, slot_value(self.obj, desc.slot))
+            for name, desc in self.cls._fields.items()
+            if getattr(desc, "slot", None) is not None)
+        return (None if obj_dict is None else dict(obj_dict)), slots
+
+    def restore(self):
+        saved_dict, saved_slots = self.saved
+        if saved_dict is not None:
+            self.obj.__dict__.clear()
+            self.obj.__dict__.update(saved_dict)
+        for name, value in saved_slots.items():
+            slot = self.cls._fields[name].slot
+            if value is _missing:
+                if slot_value(self.obj, slot) is not _missing:
+                    slot.__delete__(self.obj)
+            else:
+                slot.__set__(self.obj, value)
+
+    def validate(self):
+        """Validate the fields whose values were replaced during the
+        batch, in definition order, once all of them are in place, and
+        store the values returned by validate(). Return the
+        ValidationErrors raised.
+
+        """
+        saved_dict, saved_slots = self.saved
+        obj = self.obj
+        errors = []
+        for name, validate, slot in self.cls._validators:
+            if slot is None:
+                value = obj.__dict__.get(name, _missing)
+                before = saved_dict.get(name, _missing)
+            else:
+                value = slot_value(obj, slot)
+                before = saved_slots[name]
+            if value is _missing or value is before:
+                continue
+            try:
+                value = validate(obj, value)
+            except ValidationError as e:
+                errors.append(e)
+                continue
+            if slot is None:
+                obj.__dict__[name] = value
+            else:
+                slot.__set__(obj, value)
+        return errors
+
+
+class Validated(with_metaclass(ValidatedMeta, object)):
+    """By inheriting from this class, classes can conveniently use
     descriptors to create automatically validated attributes like
     this:
 
@@ -21,21 +394,332 @@ class Validated(Prepareable):
             name = String()
             size = Integer()
 
+    To save memory, a class can store the values of its descriptors in
+    slots instead of the instance dict:
+
+        class Point(Validated):
+            use_slots = True
+            x = Float()
+            y = Float()
+
+    If attributes are read much more often than they are assigned, a
+    class can instead let reads bypass the descriptors:
+
+        class Config(Validated):
+            fast_reads = True
+            threads = Positive()
+
     """
+    __slots__ = ()
 
-    def __prepare__(cls, bases, *args, **kwargs):
-        return OrderedDict()
+    def batch(self):
+        """Return a context manager within which values assigned to the
+        fields of this instance aren't validated right away, but all
+        at once when the block is left, in definition order, once all
+        of them are in place. This saves repeated checks when updating
+        many fields, and avoids spurious failures of cross-field
+        descriptors like EitherOr while the instance is half updated.
+
+        If a value is invalid, or the block or a check raises an
+        exception, the instance is restored to its state before the
+        block. Invalid values raise a ValidationErrors exception
+        listing all invalid fields, other exceptions propagate.
+
+        Within the block, the class of the instance is a subclass of
+        its class whose fields are plain attributes, so type(obj) is
+        not the class, and other threads assigning to the instance skip
+        validation and see the unvalidated values. Pickling or copying
+        the instance within the block creates an instance of the class
+        holding the unvalidated values.
 
-    def __new__(cls, *args, **kwargs):
-        """Go through cls' class dict, collect all Descriptor instances,
-        and then set the name attributes for those descriptors.
+        Example:
+            class Toggle(Validated):
+                on = EitherOr("off")
+                off = EitherOr("on")
+
+            toggle = Toggle()
+            toggle.off = True
+            with toggle.batch():
+                toggle.on = True  # would fail outside of the batch
+                toggle.off = None
 
         """
-        clsdict = dict(cls.__dict__)
-        fields = [k for k, v in clsdict.items() if isinstance(v, Descriptor)]
-        for name in fields:
-            clsdict[name].name = name
-        ty = type(cls.__name__, (object, ), clsdict)
-        clsobj = ty(*args, **kwargs)
-        clsobj.__init__(*args, **kwargs)
-        return clsobj
+        return Batch(self)
+
+    @classmethod
+    def from_dict(cls, mapping):
+        """Create an instance from mapping without calling __init__.
+        All fields are validated in one pass, in definition order, and
+        if any of them fails a ValidationErrors exception listing all
+        failures is raised. Keys that are not fields are set as
+        ordinary attributes, or ignored if the instance has no __dict__,
+        like those of classes using use_slots.
+
+        Example:
+            class A(Validated):
+                f = Int()
+                g = Str()
+
+            a = A.from_dict({"f": 7, "g": "seven"})
+            A.from_dict({"f": "7", "g": 7})
+            -> ValidationErrors
+
+        """
+        obj, errors = cls._from_dict(mapping)
+        if errors:
+            raise ValidationErrors(errors)
+        return obj
+
+    @classmethod
+    def set_sampling(cls, fraction=1.0, fields=None, once=False,
+                     maxsize=1024):
+        """Only check the given fraction of the values assigned to the
+        fields named in fields, or to all fields of this class, and let
+        the others through unchecked, see Sampled. If once is True,
+        the results for the maxsize most recently checked values are
+        remembered, so each distinct value is checked only once, see
+        Memoized. Calling set_sampling() with the default arguments
+        checks every value again. Subclasses, existing ones and those
+        created afterwards, share the sampling of the fields they
+        inherit, unless they override them.
+
+        A ValueError is raised if a fraction below 1 is given for a
+        field whose descriptor converts values, like Apply, since the
+        unchecked values would be stored unconverted, or if once is
+        True for a field whose descriptor isn't pure, like EitherOr or
+        ExistingPath, since its results depend on more than the value.
+        Pass the other fields in fields instead.
+
+        This is meant for hot paths whose values are trusted, and
+        doesn't require changing the descriptors of the class.
+
+        Example:
+            Event.set_sampling(0.01)
+            Event.set_sampling(fields=["country"], once=True)
+
+        """
+        if ValidatedMeta.disabled is not None:
+            raise RuntimeError(
+                "Sampling can't be changed while validation is disabled.")
+        if not 0 <= fraction <= 1:
+            raise ValueError("fraction must be between 0 and 1.")
+        names = list(cls._fields) if fields is None else list(fields)
+        sampled = cls.__dict__.get("_unsampled", {})
+        originals = {}
+        for name in names:
+            if name not in cls._fields:
+                raise ValueError("{} has no field called {}.".format(
+                    cls.__name__, name))
+            desc = sampled.get(name)
+            if desc is None:
+                desc = ValidatedMeta.unsampled(cls, name)
+            originals[name] = desc
+            if fraction < 1 and desc.converting:
+                raise ValueError(
+                    "{}.{} converts its values and can't be sampled.".format(
+                        cls.__name__, name))
+            if once and not desc.pure:
+                raise ValueError(
+                    "{}.{} depends on more than the value and can't be "
+                    "checked once.".format(cls.__name__, name))
+        if "_unsampled" not in cls.__dict__:
+            cls._unsampled = {}  # field name -> original descriptor
+        replaced = dict((name, cls._fields[name]) for name in names)
+        replacements = {}
+        for name in names:
+            desc = originals[name]
+            cls._unsampled.pop(name, None)
+            replacement = desc.memoize(maxsize) if once else desc
+            if fraction < 1:
+                replacement = replacement.sample(fraction)
+            if replacement is not desc:
+                cls._unsampled[name] = desc
+            replacements[name] = replacement
+        ValidatedMeta.replace_fields(cls, replacements)
+        subclasses = cls.__subclasses__()
+        while subclasses:
+            subclass = subclasses.pop(0)
+            subclasses.extend(subclass.__subclasses__())
+            inherited = dict(
+                (name, desc) for name, desc in replacements.items()
+                if subclass._fields.get(name) is replaced[name])
+            if not inherited:
+                continue
+            if "_unsampled" not in subclass.__dict__:
+                subclass._unsampled = {}
+            for name in inherited:
+                subclass._unsampled.pop(name, None)
+                if name in cls._unsampled:
+                    subclass._unsampled[name] = cls._unsampled[name]
+            ValidatedMeta.replace_fields(subclass, inherited)
+
+    @classmethod
+    def avalidate(cls, mapping, executor=None):
+        """Return a coroutine that creates an instance from mapping like
+        from_dict(), for use in asyncio programs. Descriptors that block
+        on I/O, like ExistingPath, run in executor, or the default
+        executor of the event loop, and coroutine functions passed to
+        Satisfies, NotSatisfies and Apply are awaited. These fields are
+        validated concurrently. Requires Python 3.5 or newer.
+
+        Example:
+            async def handle(request):
+                job = await Job.avalidate(await request.json())
+
+        """
+        from descriptors.asynchronous import validate_mapping
+        return validate_mapping(cls, mapping, executor)
+
+    @classmethod
+    def validate_many(cls, mappings, on_error="raise", workers=None):
+        """Yield an instance created by from_dict() for each mapping
+        in mappings. If a mapping is invalid, on_error determines what
+        happens: "raise" raises the ValidationErrors exception, "skip"
+        skips the mapping and "yield" yields the exception instead of
+        an instance.
+
+        If workers is given, up to workers mappings are validated at
+        once in a thread pool, which overlaps the blocking I/O of
+        descriptors like ExistingPath. The results are still yielded
+        in order.
+
+        """
+        if on_error not in ("raise", "skip", "yield"):
+            raise ValueError(
+                "on_error must be one of 'raise', 'skip' or 'yield'.")
+        if workers is None:
+            return cls._validate_many(map(cls._from_dict, mappings), on_error)
+        return cls._validate_threaded(mappings, on_error, workers)
+
+    @classmethod
+    def _validate_threaded(cls, mappings, on_error, workers):
+        with thread_pool(workers) as executor:
+            results = ordered_map(
+                executor, cls._from_dict, mappings, 2 * workers)
+            for result in cls._validate_many(results, on_error):
+                yield result
+
+    @classmethod
+    def validate_stream(
+            cls, records, workers=None, chunksize=256, on_error="raise"):
+        """Like validate_many(), but validate the mappings in records
+        in chunks of chunksize mappings in a pool of workers processes,
+        by default one per CPU. Since the processes don't share the
+        GIL, this speeds up validating large streams of records whose
+        checks are CPU-bound, like regular expressions or Satisfies
+        with an expensive function. The results are yielded in order,
+        and at most two chunks per process are read ahead of them.
+
+        The class must be importable by the worker processes, i.e.
+        defined at the top level of a module, and the records, the
+        instances and their attribute values must be picklable. On
+        platforms that start processes with spawn, like Windows and
+        macOS, the calling code has to be guarded by
+        if __name__ == "__main__".
+
+        Example:
+            for row in Row.validate_stream(csv.DictReader(f), 8):
+                ...
+
+        """
+        if on_error not in ("raise", "skip", "yield"):
+            raise ValueError(
+                "on_error must be one of 'raise', 'skip' or 'yield'.")
+        if workers is None:
+            import multiprocessing  # slow to import, only needed here
+            workers = multiprocessing.cpu_count()
+        return cls._validate_stream(records, workers, chunksize, on_error)
+
+    @classmethod
+    def _validate_stream(cls, records, workers, chunksize, on_error):
+        with process_pool(workers) as executor:
+            chunks = ordered_map(
+                executor, cls._validate_chunk, chunked(records, chunksize),
+                2 * workers)
+            results = chain.from_iterable(chunks)
+            for result in cls._validate_many(results, on_error):
+                yield result
+
+    @classmethod
+    def _validate_chunk(cls, mappings):
+        """Run _from_dict() for each of mappings in a worker process.
+        Instances that failed validation aren't sent back.
+
+        """
+        results = []
+        for mapping in mappings:
+            obj, errors = cls._from_dict(mapping)
+            results.append((None, errors) if errors else (obj, None))
+        return results
+
+    @classmethod
+    def _validate_many(cls, results, on_error):
+        for obj, errors in results:
+            if not errors:
+                yield obj
+            elif on_error == "yield":
+                yield ValidationErrors(errors)
+            elif on_error == "raise":
+                raise ValidationErrors(errors)
+
+    @classmethod
+    def _from_dict(cls, mapping):
+        """Return an instance created from mapping and a list of the
+        ValidationErrors raised by its fields, or None if there were
+        none.
+
+        """
+        obj = cls.__new__(cls)
+        obj_dict = getattr(obj, "__dict__", None)
+        errors = None
+        found = 0
+        for name, validate, slot in cls._validators:
+            if name in mapping:
+                found += 1
+                try:
+                    value = validate(obj, mapping[name])
+                except ValidationError as e:
+                    if errors is None:
+                        errors = []
+                    errors.append(e)
+                    continue
+                if slot is None:
+                    obj_dict[name] = value
+                else:
+                    slot.__set__(obj, value)
+        if found < len(mapping) and obj_dict is not None:
+            fields = cls._fields
+            for key, value in mapping.items():
+                if key not in fields:
+                    setattr(obj, key, value)
+        return obj, errors
+
+
+def disable_validation():
+    """Turn the fields of all Validated classes, including those created
+    until enable_validation() is called, into plain attributes whose
+    values aren't checked, e.g. for benchmarks or trusted batch jobs.
+
+    """
+    if ValidatedMeta.disabled is not None:
+        return
+    ValidatedMeta.disabled = OrderedDict()
+    classes = [Validated]
+    while classes:  # base classes are disabled before their subclasses
+        cls = classes.pop(0)
+        if "_batch_of" in cls.__dict__:
+            continue  # its fields are plain attributes already
+        if cls not in ValidatedMeta.disabled:  # multiple inheritance
+            ValidatedMeta.disable(cls)
+            classes.extend(cls.__subclasses__())
+
+
+def enable_validation():
+    """Check the values of all fields again after
+    disable_validation().
+
+    """
+    disabled = ValidatedMeta.disabled
+    ValidatedMeta.disabled = None
+    for cls, fields in (disabled or {}).items():
+        ValidatedMeta.replace_fields(cls, fields)
@@ -2,20 +2,59 @@
 #
 # Expose Descriptor, Validated, and all descriptors so they can be
 # imported via "from descriptors import ..."
+#
+# The classes in descriptors.massproduced are only created when they
+# are first accessed, so they are looked up by __getattr__ below.
 
 from __future__ import print_function, unicode_literals, division
 
-from descriptors.Descriptor import Descriptor
-from descriptors.Validated import Validated
+import sys
+
+from descriptors.Descriptor import (
+    Descriptor, DescriptorMeta, ValidationError, ValidationErrors, All, Any,
+    Memoized, Sampled)
+from descriptors.Validated import (
+    Validated, disable_validation, enable_validation)
+from descriptors.profiling import (
+    stats, enable_stats, disable_stats, reset_stats)
 import descriptors.handmade as hm
 import descriptors.massproduced as mm
 
-_all_descriptors = set([
-    (obj_name, obj)
-    for module in (hm, mm)
-    for obj_name, obj in module.__dict__.items()
-    if obj.__class__.__name__ == "DescriptorMeta"])
+_handmade = dict(
+    (obj_name, obj) for obj_name, obj in hm.__dict__.items()
+    if obj.__class__ is DescriptorMeta and obj is not Descriptor)
+
+globals().update(_handmade)
+
+__all__ = sorted(
+    ["Descriptor", "ValidationError", "ValidationErrors", "All", "Any",
+     "Memoized", "Sampled", "Validated", "disable_validation",
+     "enable_validation", "stats", "enable_stats", "disable_stats",
+     "reset_stats"] + list(_handmade) + list(mm.funcs_by_name))
+
+
+def __getattr__(name):
+    """Return the massproduced descriptor class called name, or, for
+    _all_descriptors, the set of (name, class) tuples of all descriptor
+    classes.
+
+    """
+    if name == "_all_descriptors":
+        value = set(_handmade.items()) | set(
+            mm.descriptor_classes().items())
+    elif name in mm.funcs_by_name:
+        value = getattr(mm, name)
+    else:
+        raise AttributeError(
+            "module {} has no attribute {}".format(__name__, name))
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
-_all_descriptors.discard(("Descriptor", Descriptor))
 
-globals().update(_all_descriptors)
+if sys.version_info < (3, 7):  # no module __getattr__
+    globals().update(mm.descriptor_classes())
+    _all_descriptors = __getattr__("_all_descriptors")
@@ -0,0 +1,103 @@
+# descriptors.arrays
+#
+# Helpers for validating whole NumPy arrays at once. NumPy is an
+# optional dependency, only needed for Descriptor.validate_array().
+
+from __future__ import print_function, unicode_literals, division
+
+import sys
+
+_numpy = []
+
+
+def numpy():
+    """Return the numpy module, or None if NumPy isn't installed. It is
+    imported on first use, since importing NumPy takes several times
+    longer than importing this package.
+
+    """
+    if not _numpy:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _numpy.append(numpy)
+    return _numpy[0]
+
+
+def __getattr__(name):
+    # keeps "from descriptors.arrays import np" working
+    if name == "np":
+        return numpy()
+    raise AttributeError(
+        "module {} has no attribute {}".format(__name__, name))
+
+
+if sys.version_info < (3, 7):  # no module __getattr__
+    np = numpy()
+
+
+class Blank(object):
+    """Stand-in for the instance passed to validate() when validating
+    array elements, which don't belong to any instance.
+
+    """
+
+
+def asarray(values):
+    """Return values as a NumPy array, or raise an ImportError if NumPy
+    isn't installed.
+
+    """
+    np = numpy()
+    if np is None:
+        raise ImportError("Validating arrays requires NumPy.")
+    return np.asarray(values)
+
+
+def elementwise(validate, array):
+    """Return a boolean mask that is True for each element of array
+    for which validate doesn't raise a ValueError.
+
+    """
+    instance = Blank()
+
+    def satisfied(value):
+        try:
+            validate(instance, value)
+        except ValueError:
+            return False
+        return True
+    mask = numpy().fromiter(
+        (satisfied(value) for value in array.flat), dtype=bool,
+        count=array.size)
+    return mask.reshape(array.shape)
+
+
+def type_mask(array, ty, validate):
+    """Return a boolean mask that is True for each element of array
+    that is an instance of ty. For arrays with a fixed dtype only the
+    dtype is checked, arrays of objects are checked element by element
+    with validate.
+
+    """
+    if array.dtype == object:
+        return elementwise(validate, array)
+    satisfied = array.dtype.kind in dtype_kinds.get(ty, "")
+    return numpy().full(array.shape, satisfied)
+
+
+def invalid_indices(mask):
+    """Return the indices of the False elements of mask."""
+    np = numpy()
+    return np.argwhere(~mask) if mask.ndim > 1 else np.flatnonzero(~mask)
+
+
+# Python builtin type -> NumPy dtype kinds whose elements are
+# instances of that type, following isinstance(True, int) == True
+dtype_kinds = {
+    bool: "b",
+    int: "biu",
+    float: "f",
+    complex: "c",
+    str: "U"}
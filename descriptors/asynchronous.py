@@ -0,0 +1,134 @@
+# descriptors.asynchronous
+#
+# Validation for asyncio programs: blocking descriptors run in an
+# executor, and coroutine functions passed to Satisfies, NotSatisfies
+# and Apply are awaited. Requires Python 3.5 or newer.
+
+from __future__ import print_function, unicode_literals, division
+
+import asyncio
+
+from descriptors.Descriptor import (
+    All, Any, Memoized, Sampled, ValidationError, ValidationErrors)
+from descriptors.handmade import Apply
+from descriptors.massproduced import Satisfies, NotSatisfies
+
+
+def awaited_function(desc):
+    """Return the coroutine function of a Satisfies, NotSatisfies or
+    Apply descriptor, or None if desc has none.
+
+    """
+    if isinstance(desc, (Satisfies, NotSatisfies)):
+        func = desc.function
+    elif isinstance(desc, Apply):
+        func = desc.func
+    else:
+        return None
+    return func if asyncio.iscoroutinefunction(func) else None
+
+
+def needs_awaiting(desc):
+    """Return True if validating desc blocks or involves a coroutine
+    function.
+
+    """
+    if isinstance(desc, All):
+        return any(needs_awaiting(d) for d in desc.descriptors)
+    if isinstance(desc, (Memoized, Sampled)):
+        return needs_awaiting(desc.descriptor)
+    return desc.blocking or awaited_function(desc) is not None
+
+
+async def validate_value(desc, instance, value, executor=None):
+    """Return the value to store if value satisfies desc, or raise a
+    ValidationError otherwise, like desc.validate(). Blocking
+    descriptors run in executor, or the default executor of the event
+    loop if executor is None, and coroutine functions are awaited.
+
+    """
+    if isinstance(desc, Any):
+        for d in desc.descriptors:
+            try:
+                return await validate_value(d, instance, value, executor)
+            except ValidationError:
+                pass
+        raise ValidationError(desc, instance, value)
+    if isinstance(desc, All):
+        result = value
+        try:
+            for d in desc.descriptors:
+                result = await validate_value(d, instance, result, executor)
+        except ValidationError:
+            raise ValidationError(desc, instance, value)
+        return result
+    if isinstance(desc, Sampled):
+        if not desc.sampled():
+            return value
+        return await validate_value(
+            desc.descriptor, instance, value, executor)
+    if (isinstance(desc, Memoized) and not desc.blocking
+            and needs_awaiting(desc.descriptor)):
+        # results involving coroutine functions aren't cached
+        return await validate_value(
+            desc.descriptor, instance, value, executor)
+    func = awaited_function(desc)
+    if func is not None:
+        result = await func(value)
+        if isinstance(desc, Apply):
+            return result
+        if bool(result) == isinstance(desc, NotSatisfies):
+            raise ValidationError(desc, instance, value)
+        return value
+    if desc.blocking:
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            executor, desc.validate, instance, value)
+    return desc.validate(instance, value)
+
+
+async def validate_mapping(cls, mapping, executor=None):
+    """Create an instance of the Validated class cls from mapping like
+    cls.from_dict(), but validate the fields whose descriptors block
+    or await coroutine functions concurrently. The other fields are
+    validated afterwards, in definition order, so cross-field
+    descriptors like EitherOr see the same values as with
+    from_dict().
+
+    """
+    obj = cls.__new__(cls)
+    present = [
+        (name, validate, slot) for name, validate, slot in cls._validators
+        if name in mapping]
+    awaited = [
+        name for name, _, _ in present if needs_awaiting(cls._fields[name])]
+    results = await asyncio.gather(*[
+        validate_value(cls._fields[name], obj, mapping[name], executor)
+        for name in awaited], return_exceptions=True)
+    results = dict(zip(awaited, results))
+    errors = []
+    for name, validate, slot in present:
+        if name in results:
+            value = results[name]
+            if isinstance(value, BaseException):
+                if not isinstance(value, ValidationError):
+                    raise value
+                errors.append(value)
+                continue
+        else:
+            try:
+                value = validate(obj, mapping[name])
+            except ValidationError as e:
+                errors.append(e)
+                continue
+        if slot is None:
+            obj.__dict__[name] = value
+        else:
+            slot.__set__(obj, value)
+    if errors:
+        raise ValidationErrors(errors)
+    if hasattr(obj, "__dict__"):  # see Validated.from_dict()
+        for key, value in mapping.items():
+            if key not in cls._fields:
+                setattr(obj, key, value)
+    return obj
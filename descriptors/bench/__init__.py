@@ -0,0 +1,45 @@
+# descriptors.bench
+#
+# Micro-benchmarks for the descriptors package. Each module in this
+# package can be run on its own, e.g.
+#     python -m descriptors.bench.instantiation
+# and python -m descriptors.bench runs the suite in bench.suite.
+
+from __future__ import print_function, unicode_literals, division
+
+import timeit
+
+
+def rate(func, number=100000, repeat=5):
+    """Return how many times per second func can be called, using the
+    best of repeat runs of number calls each.
+
+    """
+    best = min(timeit.repeat(func, number=number, repeat=repeat))
+    return number / best
+
+
+def autorate(func, repeat=3, min_time=0.05):
+    """Return how many times per second func can be called, using the
+    best of repeat runs of as many calls as take at least min_time
+    seconds.
+
+    """
+    number = 1
+    while True:
+        elapsed = timeit.timeit(func, number=number)
+        if elapsed >= min_time:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+    return rate(func, number, repeat)
+
+
+def report(label, ops_per_sec, baseline=None):
+    """Print a single benchmark result, optionally relative to the
+    ops_per_sec of a baseline.
+
+    """
+    line = "{:<40} {:>14,.0f} ops/s".format(label, ops_per_sec)
+    if baseline:
+        line += "  ({:.1f}x)".format(ops_per_sec / baseline)
+    print(line)
@@ -0,0 +1,76 @@
+# descriptors.bench.__main__
+#
+# Runs the benchmark suite in descriptors.bench.suite:
+#     python -m descriptors.bench [--filter compose/and] [--json]
+#         [--save results.json] [--compare baseline.json]
+# With --compare, exits with status 1 if a benchmark got slower than
+# in the baseline by more than --threshold.
+
+from __future__ import print_function, unicode_literals, division
+
+import argparse
+import json
+import sys
+
+from descriptors.bench import report
+from descriptors.bench.suite import run, compare
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m descriptors.bench",
+        description="Benchmark all descriptors and compositions.")
+    parser.add_argument(
+        "--filter", nargs="+", metavar="SUBSTRING",
+        help="only run benchmarks whose names contain one of these")
+    parser.add_argument(
+        "--json", action="store_true",
+        help="print the results as JSON instead of a table")
+    parser.add_argument(
+        "--save", metavar="FILE", help="save the results as JSON")
+    parser.add_argument(
+        "--compare", metavar="FILE",
+        help="compare with results saved with --save")
+    parser.add_argument(
+        "--threshold", type=float, default=0.1,
+        help="fraction by which a benchmark may be slower than the "
+             "baseline before it counts as a regression (default 0.1)")
+    parser.add_argument(
+        "--min-time", type=float, default=0.05,
+        help="seconds each timing run takes at least (default 0.05)")
+    parser.add_argument(
+        "--repeat", type=int, default=3,
+        help="timing runs per benchmark, the best is kept (default 3)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    def progress(name, ops):
+        base = baseline and baseline["results"].get(name)
+        report(name, ops, base)
+    results = run(
+        args.filter, min_time=args.min_time, repeat=args.repeat,
+        progress=None if args.json else progress)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+    if baseline is None:
+        return 0
+    regressions = [row for row in compare(
+        results, baseline, args.threshold) if row[-1]]
+    for name, ops, base, ratio, _ in regressions:
+        print("regression: {} {:,.0f} -> {:,.0f} ops/s ({:.2f}x)".format(
+            name, base, ops, ratio), file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
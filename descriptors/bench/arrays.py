@@ -0,0 +1,33 @@
+# descriptors.bench.arrays
+#
+# Compare validating a column of values one assignment at a time with
+# Descriptor.validate_array(). Requires NumPy.
+
+from __future__ import print_function, unicode_literals, division
+
+from descriptors import Validated, Int, InRange
+from descriptors.arrays import np
+from descriptors.bench import rate, report
+
+size = 10 ** 5
+
+
+def main():
+    column = np.random.randint(0, 10, size)
+    values = column.tolist()
+    for label, desc in (("InRange", InRange(0, 9)), ("Int", Int())):
+        a = type(str("A"), (Validated, ), {"f": desc})()
+
+        def per_element():
+            for value in values:
+                a.f = value
+        base = rate(per_element, number=1, repeat=3) * size
+        report(label + " per element (values)", base)
+        report(
+            label + " validate_array (values)",
+            rate(lambda: desc.validate_array(column), number=10) * size,
+            base)
+
+
+if __name__ == "__main__":
+    main()
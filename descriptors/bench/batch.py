@@ -0,0 +1,47 @@
+# descriptors.bench.batch
+#
+# Compare validating rows one setattr at a time with
+# Validated.from_dict() and Validated.validate_many().
+
+from __future__ import print_function, unicode_literals, division
+
+from descriptors import Validated, Int, Str, Float, InRange, MaxLength
+from descriptors.bench import rate, report
+
+
+class Row(Validated):
+    id = Int()
+    name = Str() & MaxLength(20)
+    score = Float()
+    level = InRange(1, 5)
+
+
+rows = [
+    {"id": i, "name": "row{}".format(i), "score": i / 7, "level": i % 5 + 1}
+    for i in range(1000)]
+
+
+def main():
+    def per_attribute():
+        for row in rows:
+            obj = Row()
+            for key, value in row.items():
+                setattr(obj, key, value)
+
+    def from_dict():
+        for row in rows:
+            Row.from_dict(row)
+
+    def validate_many():
+        for _ in Row.validate_many(rows):
+            pass
+    base = rate(per_attribute, number=20) * len(rows)
+    report("setattr per field (rows)", base)
+    report("from_dict (rows)", rate(from_dict, number=20) * len(rows), base)
+    report(
+        "validate_many (rows)",
+        rate(validate_many, number=20) * len(rows), base)
+
+
+if __name__ == "__main__":
+    main()
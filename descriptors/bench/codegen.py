@@ -0,0 +1,71 @@
+# descriptors.bench.codegen
+#
+# Compare validating rows with hand-written checks, with from_dict()
+# calling the validate method of each field, and with from_dict()
+# compiled by compile_schema.
+
+from __future__ import print_function, unicode_literals, division
+
+from descriptors import (
+    Validated, Int, Str, Float, InRange, MaxLength, GreaterThan)
+from descriptors.bench import rate, report
+
+
+class Row(Validated):
+    id = Int()
+    name = Str() & MaxLength(20)
+    score = Float() & GreaterThan(-1.0)
+    level = InRange(1, 5)
+
+
+class CompiledRow(Row):
+    compile_schema = True
+
+
+class ManualRow(object):
+    pass
+
+
+def manual_from_dict(row):
+    obj = ManualRow()
+    value = row["id"]
+    if not isinstance(value, int):
+        raise ValueError(value)
+    obj.id = value
+    value = row["name"]
+    if not (isinstance(value, str) and len(value) <= 20):
+        raise ValueError(value)
+    obj.name = value
+    value = row["score"]
+    if not (isinstance(value, float) and value > -1.0):
+        raise ValueError(value)
+    obj.score = value
+    value = row["level"]
+    if not 1 <= value <= 5:
+        raise ValueError(value)
+    obj.level = value
+    return obj
+
+
+rows = [
+    {"id": i, "name": "row{}".format(i), "score": i / 7, "level": i % 5 + 1}
+    for i in range(1000)]
+
+
+def main():
+    def validate(from_dict):
+        for row in rows:
+            from_dict(row)
+    base = rate(lambda: validate(manual_from_dict), number=20) * len(rows)
+    report("hand-written checks (rows)", base)
+    report(
+        "from_dict (rows)",
+        rate(lambda: validate(Row.from_dict), number=20) * len(rows), base)
+    report(
+        "compiled from_dict (rows)",
+        rate(lambda: validate(CompiledRow.from_dict), number=20) * len(rows),
+        base)
+
+
+if __name__ == "__main__":
+    main()
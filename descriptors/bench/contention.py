@@ -0,0 +1,55 @@
+# descriptors.bench.contention
+#
+# Measure how validating with shared descriptors scales with the
+# number of threads. With the GIL the total throughput stays flat at
+# best; on a free-threaded build it should grow with the number of
+# cores, since validating never writes to the shared descriptors.
+
+from __future__ import print_function, unicode_literals, division
+
+import threading
+import time
+
+from descriptors import Validated, Int, Str, Positive, MaxLength, In
+from descriptors.bench import report
+
+rows_per_thread = 20000
+
+
+class Row(Validated):
+    id = Int() & Positive()
+    name = Str() & MaxLength(20)
+    kind = In(["a", "b", "c"])
+
+
+def throughput(n_threads):
+    rows = [
+        {"id": i + 1, "name": "row{}".format(i), "kind": "abc"[i % 3]}
+        for i in range(rows_per_thread)]
+    start = threading.Barrier(n_threads + 1)
+
+    def run():
+        start.wait()
+        for row in rows:
+            Row.from_dict(row)
+    threads = [threading.Thread(target=run) for _ in range(n_threads)]
+    for thread in threads:
+        thread.start()
+    start.wait()
+    began = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return n_threads * rows_per_thread / (time.perf_counter() - began)
+
+
+def main():
+    base = throughput(1)
+    report("1 thread (rows)", base)
+    for n_threads in (2, 4, 8, 16, 32):
+        report(
+            "{} threads (rows)".format(n_threads), throughput(n_threads),
+            base)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# descriptors.bench.disjunctions
+#
+# Time assignments to OR chains of increasing depth in which only the
+# last descriptor is satisfied, comparing with the previous way of
+# telling failed checks from other errors by inspecting the traceback.
+
+from __future__ import print_function, unicode_literals, division
+
+import sys
+from functools import reduce
+from operator import or_
+
+from descriptors import Descriptor, Validated, GreaterThan, Positive
+from descriptors.bench import rate, report
+
+
+def legacy_exc_thrown_by_descriptor():
+    traceback = sys.exc_info()[2]
+    tb_locals = traceback.tb_frame.f_locals
+    return isinstance(tb_locals.get("self"), Descriptor)
+
+
+def legacy_or(setter1, setter2):
+    """Return a setter for the disjunction of two setters that behaves
+    like the one Descriptor.__or__ used to create.
+
+    """
+    def new_set(instance, value, name=None):
+        self = marker  # the frame local the old check relied on
+        exceptions = 0
+        for setter in (setter1, setter2):
+            try:
+                setter(instance, value, name=name)
+                return
+            except ValueError as e:
+                if legacy_exc_thrown_by_descriptor():
+                    exceptions += 1
+                else:
+                    raise e
+        if exceptions >= 2:
+            raise ValueError(self.err_msg(instance, value))
+    return new_set
+
+
+marker = Positive()
+marker.name = "f"
+
+
+def main():
+    for depth in (2, 4, 8, 16):
+        descs = [GreaterThan(1000 + i) for i in range(depth - 1)]
+        descs.append(Positive())
+        A = type(str("A"), (Validated, ), {"f": reduce(or_, descs)})
+        a = A()
+        legacy = reduce(legacy_or, [desc.__set__ for desc in descs])
+
+        def set_legacy():
+            legacy(a, 7, "f")
+
+        def set_current():
+            a.f = 7
+        base = rate(set_legacy, number=20000)
+        report("OR depth {} (legacy)".format(depth), base)
+        report("OR depth {}".format(depth), rate(set_current), base)
+
+
+if __name__ == "__main__":
+    main()
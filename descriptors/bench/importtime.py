@@ -0,0 +1,67 @@
+# descriptors.bench.importtime
+#
+# Measure how long importing the package takes, using the
+# -X importtime option of Python 3.7+, in fresh interpreters. Reports
+# the median total and the modules that take longest by themselves.
+
+from __future__ import print_function, unicode_literals, division
+
+import subprocess
+import sys
+
+runs = 15
+
+
+def import_times(statement="import descriptors"):
+    """Return a dict mapping the names of the modules imported by
+    statement in a fresh interpreter to their (self, cumulative)
+    import times in microseconds.
+
+    """
+    stderr = subprocess.check_output(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        stderr=subprocess.STDOUT, universal_newlines=True)
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        if own.strip().isdigit():
+            times[name.strip()] = (int(own), int(cumulative))
+    return times
+
+
+def median(values):
+    values = sorted(values)
+    return values[len(values) // 2]
+
+
+def class_creation_time():
+    """Return the seconds it takes to create all descriptor classes
+    after importing the package, in a fresh interpreter.
+
+    """
+    return float(subprocess.check_output(
+        [sys.executable, "-c",
+         "import time, descriptors; start = time.perf_counter(); "
+         "descriptors._all_descriptors; "
+         "print(time.perf_counter() - start)"]))
+
+
+def main():
+    samples = [import_times() for _ in range(runs)]
+    total = median(sample["descriptors"][1] for sample in samples)
+    print("{:<40} {:>10.1f} ms".format("import descriptors", total / 1000))
+    creation = median(class_creation_time() for _ in range(runs))
+    print("{:<40} {:>10.1f} ms".format(
+        "create all descriptor classes", creation * 1000))
+    print("slowest modules (median own time):")
+    own = dict(
+        (name, median(sample[name][0] for sample in samples))
+        for name in samples[0])
+    for name in sorted(own, key=own.get, reverse=True)[:8]:
+        print("  {:<38} {:>10.1f} ms".format(name, own[name] / 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# descriptors.bench.instantiation
+#
+# Compare instances per second of Validated subclasses with the
+# previous implementation, which built a new class on every
+# instantiation, and with plain objects.
+
+from __future__ import print_function, unicode_literals, division
+
+from descriptors import Descriptor, Validated, Int, Str, InRange
+from descriptors.bench import rate, report
+
+
+class Record(Validated):
+    id = Int()
+    name = Str()
+    score = InRange(0, 100)
+
+    def __init__(self):
+        self.flag = True
+
+
+class Plain(object):
+
+    def __init__(self):
+        self.flag = True
+
+
+def legacy_new(cls):
+    """Instantiate cls the way Validated.__new__ used to: copy the
+    class dict, name the descriptors, create a new class and run
+    __init__ twice.
+
+    """
+    clsdict = dict(cls.__dict__)
+    fields = [k for k, v in clsdict.items() if isinstance(v, Descriptor)]
+    for name in fields:
+        clsdict[name].name = name
+    ty = type(cls.__name__, (object, ), clsdict)
+    clsobj = ty()
+    clsobj.__init__()
+    return clsobj
+
+
+def main():
+    legacy = rate(lambda: legacy_new(Record), number=20000)
+    report("legacy Validated()", legacy)
+    report("Validated()", rate(Record), legacy)
+    report("plain object()", rate(Plain), legacy)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+# descriptors.bench.membership
+#
+# Compare checking membership in a large vocabulary passed to In as a
+# list, before and after In indexed its valid values.
+
+from __future__ import print_function, unicode_literals, division
+
+from descriptors import Validated, In
+from descriptors.bench import rate, report
+
+codes = ["C{:05d}".format(i) for i in range(50000)]
+
+
+class Indexed(Validated):
+    code = In(codes)
+    number = In(range(0, 10 ** 9, 7))
+
+
+class Unindexed(Validated):
+    code = In(codes)
+
+
+# check the list itself, like In did before indexing
+Unindexed.code.members = None
+
+
+def main():
+    indexed, unindexed = Indexed(), Unindexed()
+    base = rate(lambda: setattr(unindexed, "code", codes[-1]), number=200)
+    report("In(list of 50k) (scan)", base)
+    report(
+        "In(list of 50k) (indexed)",
+        rate(lambda: setattr(indexed, "code", codes[-1])), base)
+    report(
+        "In(range) with a float",
+        rate(lambda: setattr(indexed, "number", 7.0 * 10 ** 7)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+# descriptors.bench.memoize
+#
+# Compare validating a stream of heavily repeated categorical values
+# with an expensive check, with and without memoization.
+
+from __future__ import print_function, unicode_literals, division
+
+import random
+
+from descriptors import Validated, Str, Satisfies
+from descriptors.bench import rate, report
+
+random.seed(0)
+countries = ["C{:03d}".format(i) for i in range(200)]
+stream = [random.choice(countries) for _ in range(10000)]
+
+
+def lookup_country(code):
+    # stands in for a lookup in a large table or a remote service
+    return sum(ord(c) for c in code * 50) > 0
+
+
+class Plain(Validated):
+    country = Str() & Satisfies(lookup_country)
+
+
+class Cached(Validated):
+    country = (Str() & Satisfies(lookup_country)).memoize()
+
+
+def main():
+    def validate(obj):
+        for value in stream:
+            obj.country = value
+    base = rate(lambda: validate(Plain()), number=1, repeat=3) * len(stream)
+    report("Satisfies (objects)", base)
+    report(
+        "memoized Satisfies (objects)",
+        rate(lambda: validate(Cached()), number=1, repeat=3) * len(stream),
+        base)
+    print(Cached.country.cache_info())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# descriptors.bench.memory
+#
+# Compare the memory used by Validated instances that store their
+# values in the instance dict with instances that use slots.
+
+from __future__ import print_function, unicode_literals, division
+
+import tracemalloc
+
+from descriptors import Validated, Int, Str, Float
+
+count = 100000
+
+
+class DictRecord(Validated):
+    id = Int()
+    name = Str()
+    score = Float()
+
+
+class SlotRecord(Validated):
+    use_slots = True
+    id = Int()
+    name = Str()
+    score = Float()
+
+
+def allocated(cls):
+    """Return the number of bytes allocated for count instances of
+    cls.
+
+    """
+    name = "record"
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    records = []
+    for i in range(count):
+        record = cls()
+        record.id = i
+        record.name = name
+        record.score = 0.5
+        records.append(record)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    return sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+
+def main():
+    base = allocated(DictRecord)
+    for label, cls in (("dict", DictRecord), ("slots", SlotRecord)):
+        size = allocated(cls)
+        print("{:<10} {:>8.1f} bytes per instance  ({:.2f}x)".format(
+            label, size / count, size / base))
+
+
+if __name__ == "__main__":
+    main()
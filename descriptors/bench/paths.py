@@ -0,0 +1,47 @@
+# descriptors.bench.paths
+#
+# Compare checking many paths with one stat call per path and with
+# one directory listing per parent directory. On network filesystems
+# the difference is much larger than on local disks.
+
+from __future__ import print_function, unicode_literals, division
+
+import os
+import shutil
+from tempfile import mkdtemp
+
+from descriptors.bench import rate, report
+from descriptors.utils.PathCache import exists_by_scanning
+
+dirs = 20
+files_per_dir = 500
+
+
+def main():
+    tmp = mkdtemp()
+    try:
+        paths = []
+        for i in range(dirs):
+            parent = os.path.join(tmp, str(i))
+            os.mkdir(parent)
+            for j in range(files_per_dir):
+                path = os.path.join(parent, str(j))
+                if j % 2:
+                    open(path, "w").close()
+                paths.append(path)
+
+        def stat_each():
+            for path in paths:
+                os.path.exists(path)
+        base = rate(stat_each, number=3) * len(paths)
+        report("os.path.exists (paths)", base)
+        report(
+            "exists_by_scanning (paths)",
+            rate(lambda: exists_by_scanning(paths), number=3) * len(paths),
+            base)
+    finally:
+        shutil.rmtree(tmp)
+
+
+if __name__ == "__main__":
+    main()
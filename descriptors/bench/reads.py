@@ -0,0 +1,47 @@
+# descriptors.bench.reads
+#
+# Compare reading and assigning validated attributes with and without
+# fast_reads, and plain attributes.
+
+from __future__ import print_function, unicode_literals, division
+
+from descriptors import Validated, Int
+from descriptors.bench import rate, report
+
+
+class Default(Validated):
+    f = Int()
+
+
+class FastReads(Validated):
+    fast_reads = True
+    f = Int()
+
+
+class Plain(object):
+    pass
+
+
+def main():
+    objs = [cls() for cls in (Plain, Default, FastReads)]
+    for obj in objs:
+        obj.f = 7
+    base_read = base_write = None
+    for obj in objs:
+        label = obj.__class__.__name__
+
+        def read():
+            obj.f
+
+        def write():
+            obj.f = 7
+        read_rate = rate(read, number=1000000)
+        write_rate = rate(write)
+        base_read = base_read or read_rate
+        base_write = base_write or write_rate
+        report(label + " read", read_rate, base_read)
+        report(label + " write", write_rate, base_write)
+
+
+if __name__ == "__main__":
+    main()
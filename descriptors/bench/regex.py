@@ -0,0 +1,55 @@
+# descriptors.bench.regex
+#
+# Compare checking a field against many regular expressions with each
+# descriptor in turn and with the RegexSet used by composed RegexMatch
+# and NotRegexMatch descriptors.
+
+from __future__ import print_function, unicode_literals, division
+
+from descriptors import Validated, All, Any, RegexMatch, NotRegexMatch
+from descriptors.bench import rate, report
+
+line = (
+    "2024-01-01 12:00:00 INFO worker-3 finished job 1234 in 0.52s "
+    "with 17 records written to /var/lib/jobs/out")
+formats = [r"^\S+ \S+ {} (.*)$".format(level) for level in (
+    "TRACE", "DEBUG", "NOTICE", "WARN", "ERROR", "FATAL", "INFO")]
+blacklist = [
+    r"\b{}\d+".format(word) for word in (
+        "segfault", "oom", "killed", "panic", "timeout", "refused",
+        "corrupt", "denied", "unreachable", "overflow")] + [
+    r".*exception.*", r"(\d+)\.(\d+)\.(\d+)\.(\d+):0\b"] * 5
+
+
+def uncombined(desc):
+    """Make the composed descriptor desc check its descriptors one by
+    one, as before they were combined.
+
+    """
+    desc.validators = tuple(d.validate for d in desc.descriptors)
+    return desc
+
+
+class Combined(Validated):
+    fmt = Any([RegexMatch(regex) for regex in formats])
+    clean = All([NotRegexMatch(regex) for regex in blacklist])
+
+
+class Separate(Validated):
+    fmt = uncombined(Any([RegexMatch(regex) for regex in formats]))
+    clean = uncombined(All([NotRegexMatch(regex) for regex in blacklist]))
+
+
+def main():
+    cases = [("fmt", "7 RegexMatch |"), ("clean", "30 NotRegexMatch &")]
+    for attr, label in cases:
+        separate, combined = Separate(), Combined()
+        base = rate(lambda: setattr(separate, attr, line), number=20000)
+        report("{} (separate)".format(label), base)
+        report(
+            "{} (RegexSet)".format(label),
+            rate(lambda: setattr(combined, attr, line), number=20000), base)
+
+
+if __name__ == "__main__":
+    main()
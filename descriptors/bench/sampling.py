@@ -0,0 +1,47 @@
+# descriptors.bench.sampling
+#
+# Compare assignments with every value checked, with a sample of the
+# values checked, with each distinct value checked once, and with
+# validation disabled, for a class whose schema isn't changed.
+
+from __future__ import print_function, unicode_literals, division
+
+import descriptors
+from descriptors import Validated, Str, Int, InRange, RegexMatch
+from descriptors.bench import rate, report
+
+
+class Event(Validated):
+    user = Str() & RegexMatch(r"^[a-z]+\d*$")
+    status = Int() & InRange(100, 599)
+
+
+def main():
+    event = Event()
+
+    def assign():
+        event.user = "alice42"
+        event.status = 200
+    base = rate(assign)
+    report("every value checked", base)
+    Event.set_sampling(0.01)
+    report("1% of the values checked", rate(assign), base)
+    Event.set_sampling(once=True)
+    report("each distinct value checked once", rate(assign), base)
+    Event.set_sampling()
+    descriptors.disable_validation()
+    report("validation disabled", rate(assign), base)
+    descriptors.enable_validation()
+
+    class Plain(object):
+        pass
+    plain = Plain()
+
+    def assign_plain():
+        plain.user = "alice42"
+        plain.status = 200
+    report("plain attributes", rate(assign_plain), base)
+
+
+if __name__ == "__main__":
+    main()
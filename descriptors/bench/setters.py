@@ -0,0 +1,71 @@
+# descriptors.bench.setters
+#
+# Micro-benchmark attribute assignment for every descriptor in
+# massproduced.funcs, comparing the compiled setter with the previous
+# chain of wrapped setters and with a plain property.
+
+from __future__ import print_function, unicode_literals, division
+
+from descriptors import Descriptor, Validated
+from descriptors import massproduced as mm
+from descriptors.bench import rate, report
+from descriptors.bench.suite import samples
+
+
+def legacy_setter(desc_cls):
+    """Return a setter that behaves like the closures
+    DescriptorMeta.add_super__set__ used to wrap around __set__.
+
+    """
+    check = desc_cls.validate
+    store = Descriptor.__set__
+
+    def store_wrapper(*args, **kwargs):
+        store(*args, **kwargs)
+        next_cls = Descriptor.__mro__[1]
+        if hasattr(next_cls, "__set__"):
+            getattr(next_cls, "__set__")(*args, **kwargs)
+
+    def wrapper(*args, **kwargs):
+        check(*args, **kwargs)
+        next_cls = desc_cls.__mro__[1]
+        if hasattr(next_cls, "__set__"):
+            store_wrapper(*args, **kwargs)
+    return wrapper
+
+
+class Plain(object):
+
+    @property
+    def f(self):
+        return self._f
+
+    @f.setter
+    def f(self, value):
+        self._f = value
+
+
+def main():
+    plain = Plain()
+
+    def set_plain():
+        plain.f = 7
+    base = rate(set_plain)
+    report("property", base, base)
+    for name, _, _ in mm.funcs:
+        args, value, _ = samples[name]
+        desc = getattr(mm, name)(*args)
+        obj = type(str("A"), (Validated, ), {"f": desc})()
+        legacy = legacy_setter(desc.__class__)
+
+        def set_legacy():
+            legacy(desc, obj, value)
+
+        def set_compiled():
+            obj.f = value
+        report(name + " (legacy)", rate(set_legacy), base)
+        report(name, rate(set_compiled), base)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+# descriptors.bench.stream
+#
+# Compare validating a stream of records with CPU-bound checks in one
+# process and sharded across a process pool with validate_stream().
+
+from __future__ import print_function, unicode_literals, division
+
+import hashlib
+
+from descriptors import Validated, Str, RegexMatch, Satisfies
+from descriptors.bench import rate, report
+
+rows = [
+    {"email": "user{}@example.com".format(i), "token": "t{}".format(i)}
+    for i in range(20000)]
+
+
+def proof_of_work(token):
+    digest = token.encode("ascii")
+    for _ in range(20):
+        digest = hashlib.sha256(digest).digest()
+    return len(digest) == 32
+
+
+class Row(Validated):
+    email = Str() & RegexMatch(r"^[\w.+-]+@[\w-]+(\.[\w-]+)+$")
+    token = Satisfies(proof_of_work)
+
+
+def main():
+    def validate(workers):
+        if workers is None:
+            results = Row.validate_many(rows)
+        else:
+            results = Row.validate_stream(rows, workers, chunksize=500)
+        for _ in results:
+            pass
+    base = rate(lambda: validate(None), number=1, repeat=3) * len(rows)
+    report("one process (objects)", base)
+    for workers in (2, 4, 8):
+        report(
+            "{} processes (objects)".format(workers),
+            rate(lambda: validate(workers), number=1, repeat=3) * len(rows),
+            base)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+# descriptors.bench.suite
+#
+# A benchmark suite covering every descriptor, & and | compositions
+# of increasing depth, Validated instantiation, attribute access and
+# batch validation, on both the success and the failure path. Run it
+# with
+#     python -m descriptors.bench
+# which can save the results as JSON and compare them with a saved
+# baseline, see descriptors/bench/__main__.py.
+
+from __future__ import print_function, unicode_literals, division
+
+import os
+import platform
+from collections import OrderedDict
+from functools import reduce
+from operator import and_, or_
+
+from descriptors import (
+    Validated, ValidationError, ValidationErrors, Int, Str, Float,
+    NotNone, GreaterThan, InRange, MaxLength)
+from descriptors.bench import autorate
+
+# descriptor name -> (constructor args, valid value, invalid value or
+# None if the descriptor can't fail)
+samples = {
+    "Bool": ((), True, 1),
+    "Int": ((), 7, 7.0),
+    "Float": ((), 7.0, 7),
+    "Complex": ((), 7j, 7),
+    "Str": ((), "seven", 7),
+    "List": ((), [7], (7, )),
+    "Dict": ((), {7: 7}, [7]),
+    "Set": ((), set([7]), [7]),
+    "Frozenset": ((), frozenset([7]), set([7])),
+    "Tuple": ((), (7, ), [7]),
+    "Positive": ((), 7, -7),
+    "SemiPositive": ((), 7, -7),
+    "Negative": ((), -7, 7),
+    "SemiNegative": ((), -7, 7),
+    "NotZero": ((), 7, 0),
+    "GreaterThan": ((3, ), 7, 1),
+    "GreaterThanOrEqual": ((3, ), 7, 1),
+    "LessThan": ((9, ), 7, 11),
+    "LessThanOrEqual": ((9, ), 7, 11),
+    "InRange": ((0, 9), 7, 11),
+    "NotNone": ((), 7, None),
+    "Callable": ((), len, 7),
+    "HasAttr": (("__len__", ), "seven", 7),
+    "Satisfies": ((lambda x: x % 2, ), 7, 8),
+    "NotSatisfies": ((lambda x: x % 2 == 0, ), 7, 8),
+    "Length": ((5, ), "seven", "six"),
+    "MinLength": ((3, ), "seven", "si"),
+    "MaxLength": ((9, ), "seven", "seventy-seven"),
+    "In": ((["one", "seven", "nine"], ), "seven", "six"),
+    "RegexMatch": ((r"^s\w+n$", ), "seven", "six"),
+    "NotRegexMatch": ((r"\d", ), "seven", "7"),
+    "Apply": ((str.lower, ), "Seven", None),
+    "ForceNumeric": ((), "7", "seven"),
+    "ExistingPath": ((), os.curdir, os.path.join(os.curdir, "no-such")),
+    "MadePath": ((), os.curdir, None),
+    # invalid objects have g = 1 set, so EitherOr fails on them
+    "EitherOr": (("g", ), 7, 7)}
+
+depths = (1, 2, 4, 8, 16)
+
+
+def setter(obj, value, attr="f"):
+    def set_valid():
+        setattr(obj, attr, value)
+    return set_valid
+
+
+def failing_setter(obj, value, attr="f"):
+    def set_invalid():
+        try:
+            setattr(obj, attr, value)
+        except ValidationError:
+            pass
+    return set_invalid
+
+
+def field_class(name, desc):
+    return type(str(name), (Validated, ), {"f": desc})
+
+
+def descriptor_cases():
+    """Yield a (name, function) pair for assigning a valid and, if
+    possible, an invalid value to each descriptor in _all_descriptors.
+
+    """
+    from descriptors import _all_descriptors
+    classes = dict(_all_descriptors)
+    missing = set(classes) - set(samples)
+    if missing:
+        raise KeyError("No benchmark samples for {}.".format(
+            ", ".join(sorted(missing))))
+    for name in sorted(classes):
+        args, valid, invalid = samples[name]
+        cls = field_class("Bench" + name, classes[name](*args))
+        yield "set/{}/valid".format(name), setter(cls(), valid)
+        if invalid is not None:
+            obj = cls()
+            obj.g = 1
+            yield "set/{}/invalid".format(name), failing_setter(obj, invalid)
+
+
+def composition_cases():
+    """Yield (name, function) pairs for compositions of depth
+    descriptors: chains of & and | and alternately nested & and |.
+
+    """
+    for depth in depths:
+        conjunction = reduce(and_, [GreaterThan(-i) for i in range(depth)])
+        # only the last alternative accepts ints
+        disjunction = reduce(
+            or_, [Str() for _ in range(depth - 1)] + [Int()])
+        nested = GreaterThan(0)
+        for _ in range(depth - 1):
+            nested = (nested | Str()) & NotNone()
+        for kind, desc, valid, invalid in [
+                ("and", conjunction, 7, -7),
+                ("or", disjunction, 7, 7.0),
+                ("nested", nested, 7, -7)]:
+            obj = field_class("Bench" + kind.title(), desc)()
+            prefix = "compose/{}/{}".format(kind, depth)
+            yield prefix + "/valid", setter(obj, valid)
+            yield prefix + "/invalid", failing_setter(obj, invalid)
+
+
+def record_class(name, **options):
+    """Return a Validated class with three fields that are set in
+    __init__, with the given class attributes, e.g. use_slots=True.
+
+    """
+    def __init__(self, id=0, name="", score=0.0):
+        self.id = id
+        self.name = name
+        self.score = score
+    attrs = OrderedDict([
+        ("id", Int()),
+        ("name", Str() & MaxLength(20)),
+        ("score", Float() & InRange(0.0, 100.0)),
+        ("__init__", __init__)])
+    attrs.update(options)
+    return type(str(name), (Validated, ), attrs)
+
+
+def validated_cases():
+    """Yield (name, function) pairs for creating Validated instances,
+    reading and writing their attributes and validating mappings.
+
+    """
+    valid = {"id": 7, "name": "seven", "score": 7.0}
+    invalid = {"id": "7", "name": "seven" * 5, "score": 700.0}
+    rows = [dict(valid, id=i) for i in range(100)]
+
+    def from_dict_failing(cls):
+        def from_dict():
+            try:
+                cls.from_dict(invalid)
+            except ValidationErrors:
+                pass
+        return from_dict
+
+    def validate_many(cls):
+        def validate():
+            for _ in cls.validate_many(rows):
+                pass
+        return validate
+
+    for variant, cls in [
+            ("dict", record_class("Record")),
+            ("slots", record_class("SlotRecord", use_slots=True)),
+            ("fast_reads", record_class("FastRecord", fast_reads=True)),
+            ("compiled", record_class(
+                "CompiledRecord", compile_schema=True))]:
+        obj = cls(7, "seven", 7.0)
+        yield "validated/{}/init".format(variant), \
+            lambda cls=cls: cls(7, "seven", 7.0)
+        yield "validated/{}/get".format(variant), lambda obj=obj: obj.name
+        yield "validated/{}/set/valid".format(variant), \
+            setter(obj, 8.0, "score")
+        yield "validated/{}/set/invalid".format(variant), \
+            failing_setter(obj, 800.0, "score")
+        yield "validated/{}/from_dict/valid".format(variant), \
+            lambda cls=cls: cls.from_dict(valid)
+        yield "validated/{}/from_dict/invalid".format(variant), \
+            from_dict_failing(cls)
+        yield "validated/{}/validate_many_100".format(variant), \
+            validate_many(cls)
+
+
+def cases():
+    """Return an OrderedDict mapping the names of all benchmarks to
+    the functions they time.
+
+    """
+    result = OrderedDict()
+    for group in (descriptor_cases, composition_cases, validated_cases):
+        result.update(group())
+    return result
+
+
+def run(selected=None, min_time=0.05, repeat=3, progress=None):
+    """Run the benchmarks whose names contain one of the strings in
+    selected, or all of them, and return a dict with information about
+    the interpreter and the results in calls per second. progress is
+    called with the name and result of each benchmark.
+
+    """
+    results = OrderedDict()
+    for name, func in cases().items():
+        if selected and not any(s in name for s in selected):
+            continue
+        results[name] = autorate(func, repeat=repeat, min_time=min_time)
+        if progress is not None:
+            progress(name, results[name])
+    return OrderedDict([
+        ("python", platform.python_version()),
+        ("implementation", platform.python_implementation()),
+        ("machine", platform.machine()),
+        ("results", results)])
+
+
+def compare(results, baseline, threshold=0.1):
+    """Return a list of (name, ops per second, baseline ops per
+    second, ratio, regressed) tuples for the benchmarks in both
+    results and baseline, which are dicts returned by run(). A
+    benchmark regressed if it is more than threshold slower.
+
+    """
+    rows = []
+    for name, ops in results["results"].items():
+        base = baseline["results"].get(name)
+        if base:
+            ratio = ops / base
+            rows.append((name, ops, base, ratio, ratio < 1 - threshold))
+    return rows
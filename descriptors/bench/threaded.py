@@ -0,0 +1,41 @@
+# descriptors.bench.threaded
+#
+# Compare validating objects whose descriptors block on I/O one after
+# the other and in a thread pool. The I/O is simulated with a sleep of
+# latency seconds, standing in for a stat call on a remote filesystem.
+
+from __future__ import print_function, unicode_literals, division
+
+import time
+
+from descriptors import Validated, Satisfies
+from descriptors.bench import rate, report
+
+latency = 0.002
+rows = [{"path": "/data/{}".format(i)} for i in range(200)]
+
+
+def remote_exists(path):
+    time.sleep(latency)
+    return True
+
+
+class Job(Validated):
+    path = Satisfies(remote_exists)
+
+
+def main():
+    def validate(workers):
+        for _ in Job.validate_many(rows, workers=workers):
+            pass
+    base = rate(lambda: validate(None), number=1, repeat=3) * len(rows)
+    report("serial (objects)", base)
+    for workers in (4, 16, 64):
+        report(
+            "{} workers (objects)".format(workers),
+            rate(lambda: validate(workers), number=1, repeat=3) * len(rows),
+            base)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# descriptors.bench.transactions
+#
+# Compare updating the fields of a large record one validated
+# assignment at a time with updating them in a batch, which validates
+# each changed field once at the end, for records whose fields are
+# assigned once or several times per update.
+
+from __future__ import print_function, unicode_literals, division
+
+from descriptors import Validated, Str, Int, InRange, RegexMatch
+from descriptors.bench import rate, report
+
+n_fields = 20
+Record = type(str("Record"), (Validated, ), dict(
+    ("f{}".format(i), Int() & InRange(0, 1000) if i % 2 else
+     Str() & RegexMatch(r"^\w+$"))
+    for i in range(n_fields)))
+# alternated, so every update changes the values of all fields
+versions = [
+    [("f{}".format(i), i + v if i % 2 else "value{}{}".format(i, v))
+     for i in range(n_fields)]
+    for v in range(2)]
+
+
+def main():
+    record = Record()
+    counter = [0]
+
+    def update(times):
+        counter[0] += 1
+        values = versions[counter[0] % 2]
+        for _ in range(times):
+            for name, value in values:
+                setattr(record, name, value)
+
+    def batch_update(times):
+        with record.batch():
+            update(times)
+    for times in (1, 3):
+        label = "{} fields, each set {}x".format(n_fields, times)
+        base = rate(lambda: update(times), number=5000)
+        report(label + ", validated", base)
+        report(
+            label + ", batch", rate(lambda: batch_update(times), number=5000),
+            base)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+# descriptors.codegen
+#
+# Compiles the fields of a Validated class into a single generated
+# function that creates instances from mappings.
+
+from __future__ import print_function, unicode_literals, division
+
+import math
+
+from descriptors.Descriptor import ValidationError
+
+# Types whose repr() is a literal evaluating to an equal value
+literal_types = (bool, int, float, type(""), type(None))
+
+
+class Constants(object):
+    """The namespace of a generated function. const() returns the
+    source code referring to a value: a literal for simple values,
+    otherwise a name bound to the value in the namespace.
+
+    """
+    def __init__(self, **names):
+        self.names = dict(names)
+        self.by_id = {}
+
+    def const(self, value):
+        if value.__class__ in literal_types and not (
+                isinstance(value, float)
+                and (math.isinf(value) or math.isnan(value))):
+            source = repr(value)
+            return "(" + source + ")" if source.startswith("-") else source
+        try:
+            return self.by_id[id(value)][0]
+        except KeyError:
+            pass
+        name = "_c{}".format(len(self.by_id))
+        self.names[name] = value
+        # keep value alive so its id isn't reused by another constant
+        self.by_id[id(value)] = (name, value)
+        return name
+
+
+def add_error(errors, error):
+    if errors is None:
+        return [error]
+    errors.append(error)
+    return errors
+
+
+def set_extra(fields, obj, mapping):
+    if not hasattr(obj, "__dict__"):  # see Validated.from_dict()
+        return
+    for key, value in mapping.items():
+        if key not in fields:
+            setattr(obj, key, value)
+
+
+def from_dict_source(cls, constants):
+    """Return the source code of a function equivalent to
+    Validated._from_dict() for cls, whose constants are in constants.
+
+    Fields whose descriptors have an inline expression are checked by
+    that expression, the others by calling their validate method.
+
+    """
+    lines = [
+        "def from_dict(mapping):",
+        "    obj = new(cls)",
+        "    errors = None",
+        "    found = 0",
+        "    get = mapping.get"]
+    if any(getattr(desc, "slot", None) is None
+           for desc in cls._fields.values()):
+        lines.append("    obj_dict = obj.__dict__")
+    const = constants.const
+    for name, desc in cls._fields.items():
+        slot = getattr(desc, "slot", None)
+        if slot is None:
+            store = "obj_dict[{}] = {{}}".format(repr(name))
+        else:
+            store = "{}(obj, {{}})".format(const(slot.__set__))
+        lines += [
+            "    value = get({}, missing)".format(repr(name)),
+            "    if value is not missing:",
+            "        found += 1"]
+        expr = desc.inline and desc.inline("value", const)
+        if expr:
+            lines += [
+                "        if {}:".format(expr),
+                "            " + store.format("value"),
+                "        else:",
+                "            errors = add_error(errors, ValidationError(",
+                "                {}, obj, value))".format(const(desc))]
+        else:
+            lines += [
+                "        try:",
+                "            " + store.format(
+                    "{}(obj, value)".format(const(desc.validate))),
+                "        except ValidationError as e:",
+                "            errors = add_error(errors, e)"]
+    lines += [
+        "    if found < len(mapping):",
+        "        set_extra(fields, obj, mapping)",
+        "    return obj, errors"]
+    return "\n".join(lines) + "\n"
+
+
+def compile_from_dict(cls):
+    """Return a function that creates an instance of the Validated
+    class cls from a mapping and returns it with a list of the
+    ValidationErrors raised by its fields, or None if there were none,
+    like Validated._from_dict().
+
+    The checks of all fields are generated as one function, with the
+    arguments of the descriptors inlined as constants, so validating a
+    mapping costs little more than a chain of hand-written if
+    statements.
+
+    """
+    constants = Constants(
+        cls=cls, new=cls.__new__, fields=cls._fields, missing=object(),
+        ValidationError=ValidationError, add_error=add_error,
+        set_extra=set_extra)
+    source = from_dict_source(cls, constants)
+    code = compile(
+        source, "<{}.from_dict>".format(cls.__name__), "exec")
+    exec(code, constants.names)
+    func = constants.names["from_dict"]
+    func.source = source
+    return func
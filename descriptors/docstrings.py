@@ -164,18 +164,6 @@ docstrings = {
         a.players = ("Ann", "Bob")
         -> ok
         a.players = ("Ann", "Bob", "Charlie")
-        -> ValueError""",
-    "ExistingPath": """A descriptor that only allows strings that
-    represent an existing path.
-
-    Example:
-        class A(Validated):
-            input_dir = ExistingPath()
-
-        a = A()
-        a.input_dir = "/tmp"
-        -> ok
-        a.input_dir = None
         -> ValueError"""
     }
 
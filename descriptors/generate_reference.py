@@ -31,7 +31,8 @@ def remove_non_code_indent(doc):
 
 def add_code_mark(doc):
     return re.sub(
-        "(.+)Example:(.+)", r"\1Example:\n\n::\n\n\2", doc, flags=re.DOTALL)
+        "(.+)Example:(.+)", r"\1Example:\n\n.. code:: python\n\n\2", doc,
+        flags=re.DOTALL)
 
 
 ranges_camel = [name for name, _, _ in range_funcs]
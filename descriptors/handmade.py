@@ -6,17 +6,31 @@
 from __future__ import print_function, unicode_literals, division
 
 import os
-import re
-from numbers import Number
+from bisect import bisect_left
+from numbers import Integral, Number, Real
+
+import six
 
 from descriptors import Descriptor
-from descriptors.massproduced import create_init
+from descriptors.Descriptor import ValidationError
+from descriptors.massproduced import call, create_init
+from descriptors.utils.PathCache import default_path_cache, check_paths
+from descriptors.utils.RegexSet import (
+    RegexSet, compile_pattern, required_literal)
 
 
 class In(Descriptor):
     """A descriptor that only allows assigning a value if that value is
     a member of a set of given elements.
 
+    Lists and tuples of valid values are indexed when the descriptor
+    is created, so checking a value takes constant time instead of
+    comparing it to every element: hashable elements are put in a
+    frozenset, and unhashable ones that can be ordered are sorted and
+    searched with bisect. Integers are checked against a range by
+    comparing them with its bounds. Other containers, e.g. strings,
+    sets and dicts, are used as they are.
+
     Example:
         class A(Validated):
             mood = In(set(["bad", "go away", "Why me!?", ":-("]))
@@ -26,20 +40,108 @@ class In(Descriptor):
         -> ValueError
 
     """
+    _init = create_init(["valid_values"])
+
     def __init__(self, valid_values):
-        create_init(["valid_values"])(self, valid_values)
+        self._init(valid_values)
         if not hasattr(valid_values, "__contains__"):
             raise TypeError(
                 "Attempted to create an In-Descriptor with an argument that "
                 "doesn't support membership testing.")
         self.valid_values = valid_values
+        self.members = None  # hashable valid values
+        self.rest = None  # unhashable valid values, sorted if possible
+        self.rest_sorted = False
+        if isinstance(valid_values, (list, tuple)):
+            self.build_index(valid_values)
+
+    def build_index(self, valid_values):
+        hashable, unhashable = [], []
+        for value in valid_values:
+            try:
+                hash(value)
+            except TypeError:
+                unhashable.append(value)
+            else:
+                hashable.append(value)
+        self.members = frozenset(hashable)
+        if not unhashable:
+            return
+        self.rest = unhashable
+        # only a total order can be searched with bisect, while sets are
+        # sortable by their subset relation
+        if all(totally_ordered(value) for value in unhashable):
+            try:
+                self.rest = sorted(unhashable)
+                self.rest_sorted = True
+            except TypeError:  # can't be ordered, e.g. lists of mixed types
+                pass
 
     def __set__(self, instance, value, name=None):
+        if not self.contains(value):
+            raise ValidationError(self, instance, value)
+
+    def contains(self, value):
+        """Return whether value is one of the valid values."""
+        if self.members is None:
+            if isinstance(self.valid_values, range_type):
+                return in_range(self.valid_values, value)
+            try:
+                return value in self.valid_values
+            except TypeError:  # raised e.g. when checking if non-str in str
+                return False
         try:
-            if not value in self.valid_values:
-                raise ValueError(self.err_msg(instance, value))
-        except TypeError:  # raised e.g. when checking if non-str in str
-            raise ValueError(self.err_msg(instance, value))
+            if value in self.members:
+                return True
+        except TypeError:  # an unhashable value may equal any element
+            return self.scan(self.valid_values, value)
+        if self.rest is None:
+            return False
+        if self.rest_sorted and totally_ordered(value):
+            try:
+                i = bisect_left(self.rest, value)
+                return i < len(self.rest) and self.rest[i] == value
+            except TypeError:  # can't be compared to the sorted values
+                pass
+        return self.scan(self.rest, value)
+
+    @staticmethod
+    def scan(values, value):
+        try:
+            return value in values
+        except TypeError:
+            return False
+
+
+range_type = type(six.moves.range(0))
+
+
+def totally_ordered(value):
+    """Return whether value only consists of lists, tuples, strings and
+    numbers other than NaN, whose comparisons are a total order.
+
+    """
+    if isinstance(value, (list, tuple)):
+        return all(totally_ordered(element) for element in value)
+    if isinstance(value, Real):
+        return value == value
+    return isinstance(value, (six.string_types, bytes))
+
+
+def in_range(valid_range, value):
+    """Return value in valid_range, without comparing value to every
+    element of the range if value is a number.
+
+    """
+    if isinstance(value, Integral):
+        return int(value) in valid_range  # constant time for ints
+    if isinstance(value, Real):
+        try:
+            integer = int(value)
+        except (TypeError, ValueError, OverflowError):  # e.g. nan, inf
+            return False
+        return value == integer and integer in valid_range
+    return value in valid_range
 
 
 class RegexMatch(Descriptor):
@@ -47,13 +149,39 @@ class RegexMatch(Descriptor):
     to a string that matches the supplied regular expression.
 
     """
+    _init = create_init(["regex"])
+
     def __init__(self, regex):
-        create_init(["regex"])(self, regex)
-        self.pattern = re.compile(regex)
+        self._init(regex)
+        self.pattern = compile_pattern(regex)
 
     def __set__(self, instance, value, name=None):
         if not self.pattern.search(value):
-            raise ValueError(self.err_msg(instance, value))
+            raise ValidationError(self, instance, value)
+
+    def inline(self, x, const):
+        check = "{}.search({}) is not None".format(const(self.pattern), x)
+        literal = required_literal(self.pattern)
+        if literal is not None:  # only a str can skip the search
+            check = "({x}.__class__ is not {str} or {lit} in {x}) " \
+                "and {check}".format(
+                    x=x, str=const(type("")), lit=const(literal),
+                    check=check)
+        return "(" + check + ")"
+
+    @classmethod
+    def combine_any(cls, descriptors):
+        """Return a validate function for descriptors combined with |,
+        which searches for their regular expressions with a RegexSet.
+
+        """
+        regexes = RegexSet([desc.pattern for desc in descriptors])
+
+        def validate(instance, value):
+            if regexes.search(value) is None:
+                raise ValidationError(descriptors[0], instance, value)
+            return value
+        return validate
 
 
 class NotRegexMatch(Descriptor):
@@ -61,13 +189,41 @@ class NotRegexMatch(Descriptor):
     to a string that does not match the supplied regular expression.
 
     """
+    _init = create_init(["regex"])
+
     def __init__(self, regex):
-        create_init(["regex"])(self, regex)
-        self.pattern = re.compile(regex)
+        self._init(regex)
+        self.pattern = compile_pattern(regex)
 
     def __set__(self, instance, value, name=None):
         if self.pattern.search(value):
-            raise ValueError(self.err_msg(instance, value))
+            raise ValidationError(self, instance, value)
+
+    def inline(self, x, const):
+        check = "{}.search({}) is None".format(const(self.pattern), x)
+        literal = required_literal(self.pattern)
+        if literal is not None:  # only a str can skip the search
+            check = "{x}.__class__ is {str} and {lit} not in {x} " \
+                "or {check}".format(
+                    x=x, str=const(type("")), lit=const(literal),
+                    check=check)
+        return "(" + check + ")"
+
+    @classmethod
+    def combine_all(cls, descriptors):
+        """Return a validate function for descriptors combined with &,
+        which searches for their regular expressions with a RegexSet
+        and raises the ValidationError of the one that matched.
+
+        """
+        regexes = RegexSet([desc.pattern for desc in descriptors])
+
+        def validate(instance, value):
+            index = regexes.search(value)
+            if index is not None:
+                raise ValidationError(descriptors[index], instance, value)
+            return value
+        return validate
 
 
 class Apply(Descriptor):
@@ -85,19 +241,19 @@ class Apply(Descriptor):
         -> some string
 
     """
-    no_autoset = True
+    converting = True
+    _init = create_init(["func"])
 
     def __init__(self, func):
-        create_init(["func"])(self, func)
+        self._init(func)
         if not callable(func):
             raise TypeError(
                 "Tried to create an Apply-Descriptor with a argument "
                 "that is not callable.")
         self.func = func
 
-    def __set__(self, instance, value, name=None):
-        value = self.func(value)
-        super(self.__class__, self).__set__(instance, value, name)
+    def validate(self, instance, value):
+        return call(self.func, value)
 
 
 class ForceNumeric(Descriptor):
@@ -129,15 +285,15 @@ class ForceNumeric(Descriptor):
         -> ValueError
 
     """
-    no_autoset = True
+    converting = True
 
-    def __set__(self, instance, value, name=None):
+    def validate(self, instance, value):
         if not isinstance(value, Number):
             try:
-                value = self.try_convert(value)
+                return self.try_convert(value)
             except ValueError:
-                raise ValueError(self.err_msg(instance, value))
-        super(self.__class__, self).__set__(instance, value, name)
+                raise ValidationError(self, instance, value)
+        return value
 
     @staticmethod
     def try_convert(value):
@@ -176,21 +332,104 @@ class ForceNumeric(Descriptor):
             return float(str_value)
 
 
+class ExistingPath(Descriptor):
+    """A descriptor that only allows strings that represent an existing
+    path.
+
+    To avoid checking the same paths over and over again, the results
+    can be cached in a PathCache by passing it as the cache argument,
+    or in a cache shared by all path descriptors by passing
+    cache=True.
+
+    Example:
+        class A(Validated):
+            input_dir = ExistingPath()
+
+        a = A()
+        a.input_dir = "/tmp"
+        -> ok
+        a.input_dir = None
+        -> ValueError
+
+    """
+    blocking = True
+    pure = False
+
+    def __init__(self, cache=None):
+        super(ExistingPath, self).__init__()
+        self.cache = default_path_cache if cache is True else cache
+
+    def validate(self, instance, value):
+        if self.cache is None:
+            exists = os.path.exists(value)
+        else:
+            exists = self.cache.exists(value)
+        if not exists:
+            raise ValidationError(self, instance, value)
+        return value
+
+    def check_paths(self, paths, workers=None):
+        """Return a dict mapping each of paths to True if it exists and
+        to False otherwise, listing each parent directory once instead
+        of checking every path separately, or, if workers is given,
+        checking up to workers paths at once in a thread pool. If this
+        descriptor has a cache, the results are stored in it, so
+        validating the paths afterwards doesn't touch the filesystem.
+
+        """
+        if self.cache is None:
+            return check_paths(paths, workers)
+        return self.cache.prefetch(paths, workers)
+
+
 class MadePath(Descriptor):
     """A descriptor that creates the path represented by the passed
     string if that path doesn't exist already.
 
+    Like ExistingPath, MadePath accepts a PathCache, or cache=True, to
+    cache which paths exist. Paths it created are added to the cache.
+
     """
+    blocking = True
+    pure = False
+
+    def __init__(self, cache=None):
+        super(MadePath, self).__init__()
+        self.cache = default_path_cache if cache is True else cache
+
     def __set__(self, instance, value, name=None):
-        if not os.path.exists(value):
-            try:
-                os.makedirs(value)
-            except OSError as e:
-                if os.path.exists(value):
-                    # path was created in the time since we checked
-                    pass
-                else:
-                    raise e
+        if self.cache is None:
+            exists = os.path.exists(value)
+        else:
+            exists = self.cache.exists(value)
+        if not exists:
+            self.make(value)
+
+    def make_paths(self, paths, workers=None):
+        """Create all of paths that don't exist yet. Which paths exist
+        is checked like in ExistingPath.check_paths().
+
+        """
+        if self.cache is None:
+            existing = check_paths(paths, workers)
+        else:
+            existing = self.cache.prefetch(paths, workers)
+        for path, exists in existing.items():
+            if not exists:
+                self.make(path)
+
+    def make(self, path):
+        """Create path and add it to the cache."""
+        try:
+            os.makedirs(path)
+        except OSError as e:
+            if os.path.exists(path):
+                # path was created in the time since we checked
+                pass
+            else:
+                raise e
+        if self.cache is not None:
+            self.cache.mark_existing(path)
 
 
 class EitherOr(Descriptor):
@@ -211,14 +450,14 @@ class EitherOr(Descriptor):
         -> ValueError
 
     """
+    pure = False
+    _init = create_init(["other_attr"])
+
     def __init__(self, other_attr):
-        create_init(["other_attr"])(self, other_attr)
+        self._init(other_attr)
 
     def __set__(self, instance, value, name=None):
-        if self.other_attr in instance.__dict__:
-            other_value = getattr(instance, self.other_attr)
-        else:
-            other_value = None
+        other_value = getattr(instance, self.other_attr, None)
         if value is not None and other_value is not None:
             if bool(value) == bool(other_value):
-                raise ValueError(self.err_msg(instance, value))
+                raise ValidationError(self, instance, value)
@@ -5,11 +5,32 @@
 
 from __future__ import print_function, unicode_literals, division
 
-import os
+import sys
+import types
+from collections import OrderedDict
 
 from descriptors import Descriptor
-from descriptors.builtin_types import builtins_str, builtins_camel
-from descriptors.docstrings import docstrings
+from descriptors.Descriptor import ValidationError
+from descriptors.arrays import type_mask
+from descriptors.builtin_types import builtins, builtins_camel
+
+
+coroutine_type = getattr(types, "CoroutineType", None)  # Python 3.5+
+
+
+def call(function, value):
+    """Return function(value) for Satisfies, NotSatisfies and Apply, or
+    raise a TypeError if function is a coroutine function, whose result
+    is only awaited by Validated.avalidate().
+
+    """
+    result = function(value)
+    if result.__class__ is coroutine_type:
+        result.close()  # don't warn that it was never awaited
+        raise TypeError(
+            "{!r} is a coroutine function, which can only be used to "
+            "validate values with Validated.avalidate().".format(function))
+    return result
 
 
 range_funcs = [
@@ -29,65 +50,215 @@ misc_funcs = [
     ("NotNone", lambda x: x is not None, []),
     ("Callable", lambda x: callable(x), []),
     ("HasAttr", lambda x, a: hasattr(x, a), ["attribute"]),
-    ("Satisfies", lambda x, a: a(x), ["function"]),
-    ("NotSatisfies", lambda x, a: not a(x), ["function"]),
+    ("Satisfies", lambda x, a: call(a, x), ["function"]),
+    ("NotSatisfies", lambda x, a: not call(a, x), ["function"]),
     ("Length", lambda x, a: len(x) == a, ["length"]),
     ("MinLength", lambda x, a: len(x) >= a, ["min_length"]),
-    ("MaxLength", lambda x, a: len(x) <= a, ["max_length"]),
-    ("ExistingPath", lambda x: os.path.exists(x), [])]
+    ("MaxLength", lambda x, a: len(x) <= a, ["max_length"])]
+
+
+def create_isinstance(ty):
+    """Create the function for the descriptor of the builtin type ty."""
+    return lambda obj: isinstance(obj, ty)
 
 # Turn the builtins tuple into a list like the other funcs lists
-builtin_func_els = ", ".join([
-    '("{name}", lambda obj: isinstance(obj, {ty}), [])'.format(
-        name=b_camel,
-        ty=b_str)
-    for b_str, b_camel in zip(builtins_str, builtins_camel)])
-list_code = "builtin_funcs = [{}]".format(builtin_func_els)
-exec(list_code, locals())
+builtin_funcs = [
+    (b_camel, create_isinstance(ty), [])
+    for ty, b_camel in zip(builtins, builtins_camel)]
 
 funcs = builtin_funcs + range_funcs + misc_funcs
 
+# Python expressions equivalent to the functions, for compiling the
+# checks of Validated classes with compile_schema into one function
+inline_templates = {
+    "Positive": "{x} > 0",
+    "SemiPositive": "{x} >= 0",
+    "Negative": "{x} < 0",
+    "SemiNegative": "{x} <= 0",
+    "NotZero": "{x} != 0",
+    "GreaterThan": "{x} > {threshold}",
+    "GreaterThanOrEqual": "{x} >= {threshold}",
+    "LessThan": "{x} < {threshold}",
+    "LessThanOrEqual": "{x} <= {threshold}",
+    "InRange": "{lower_bound} <= {x} <= {upper_bound}",
+    "NotNone": "{x} is not None",
+    "Callable": "callable({x})",
+    "HasAttr": "hasattr({x}, {attribute})",
+    "Satisfies": "{call}({function}, {x})",
+    "NotSatisfies": "not {call}({function}, {x})",
+    "Length": "len({x}) == {length}",
+    "MinLength": "len({x}) >= {min_length}",
+    "MaxLength": "len({x}) <= {max_length}"}
+inline_templates.update(
+    (b_camel, "isinstance({x}, {ty})") for b_camel in builtins_camel)
+
+# Functions that validate whole NumPy arrays, for the range_funcs
+# whose function doesn't already work elementwise on arrays
+array_funcs = {
+    "InRange": lambda x, a, b: (a <= x) & (x <= b)}
+
+
+_init_cache = {}
+
 
 def create_init(attrs):
     """Create an __init__ method that sets all the attributes
     necessary for the function the Descriptor invokes to check the
     value.
 
+    The generated methods are cached by attrs, so the source for each
+    combination of attribute names is compiled only once. Every method
+    is compiled into its own namespace, which makes this safe to call
+    from several threads at once.
+
     """
+    key = tuple(attrs)
+    try:
+        return _init_cache[key]
+    except KeyError:
+        pass
     args = ", ".join(attrs)
-    vals = ", ".join(['getattr(self, "{}")'.format(attr) for attr in attrs])
     attr_lines = "\n    ".join(
         ["self.{attr} = {attr}".format(attr=attr) for attr in attrs])
-    init_code = """def _init(self, {args}):
-    super(self.__class__, self).__init__()
+    init_code = """def __init__(self, {args}):
+    Descriptor.__init__(self)
     {attr_lines}
     self.field_type += "({{}})".format(
-        ", ".join([str(val) for val in [{vals}]]))
-    """.format(args=args, attr_lines=attr_lines, vals=vals)
-    exec(init_code, globals())
-    return _init
+        ", ".join([str(val) for val in [{args}]]))
+    """.format(args=args, attr_lines=attr_lines)
+    namespace = {"Descriptor": Descriptor}
+    exec(init_code, namespace)
+    return _init_cache.setdefault(key, namespace["__init__"])
+
+
+def create_validate(func, attrs):
+    """Create the validate method for the descriptor, from which
+    DescriptorMeta creates its __set__ method. Methods for the common
+    cases of zero and one argument avoid building an argument list on
+    every call.
+
+    """
+    if len(attrs) == 0:
+        def validate(self, instance, value):
+            if not func(value):
+                raise ValidationError(self, instance, value)
+            return value
+    elif len(attrs) == 1:
+        attr = attrs[0]
+
+        def validate(self, instance, value):
+            if not func(value, getattr(self, attr)):
+                raise ValidationError(self, instance, value)
+            return value
+    else:
+        def validate(self, instance, value):
+            args = [getattr(self, attr) for attr in attrs]
+            if not func(value, *args):
+                raise ValidationError(self, instance, value)
+            return value
+    return validate
+
 
+def create_inline(template, attrs, constants=None):
+    """Create the inline method for the descriptor, which fills in
+    template with the name of the value and its arguments. The
+    arguments are not looked up on every call, but passed to const()
+    once, which turns them into literals or names of constants.
+
+    """
+    constants = constants or {}
 
-def create_setter(func, attrs):
-    """Create the __set__ method for the descriptor."""
-    def _set(self, instance, value, name=None):
+    def inline(self, x, const):
+        args = dict((attr, const(getattr(self, attr))) for attr in attrs)
+        for name, value in constants.items():
+            args[name] = const(value)
+        return "(" + template.format(x=x, **args) + ")"
+    return inline
+
+
+def create_array_mask(func, attrs):
+    """Create the array_mask method for a descriptor whose function
+    works elementwise on NumPy arrays.
+
+    """
+    def array_mask(self, array):
         args = [getattr(self, attr) for attr in attrs]
-        if not func(value, *args):
-            raise ValueError(self.err_msg(instance, value))
-    return _set
+        return func(array, *args).astype(bool)
+    return array_mask
+
+
+def create_type_array_mask(ty):
+    """Create the array_mask method for a builtin type descriptor."""
+    def array_mask(self, array):
+        return type_mask(array, ty, self.validate)
+    return array_mask
+
+
+range_names = set(name for name, _, _ in range_funcs)
+name2builtin = dict(zip(builtins_camel, builtins))
 
 
 def make_class(clsname, func, attrs):
     """Turn a funcs list element into a class object."""
-    clsdict = {"__set__": create_setter(func, attrs)}
+    clsdict = {
+        "__module__": __name__,  # so pickle can find the class
+        "validate": create_validate(func, attrs)}
+    if clsname in range_names:
+        clsdict["vectorized"] = True
+        clsdict["array_mask"] = create_array_mask(
+            array_funcs.get(clsname, func), attrs)
+    elif clsname in name2builtin:
+        clsdict["vectorized"] = True
+        clsdict["array_mask"] = create_type_array_mask(
+            name2builtin[clsname])
+    if clsname in name2builtin:
+        clsdict["inline"] = create_inline(
+            inline_templates[clsname], attrs,
+            {"ty": name2builtin[clsname]})
+    elif clsname in inline_templates:
+        template = inline_templates[clsname]
+        clsdict["inline"] = create_inline(
+            template, attrs, {"call": call} if "{call}" in template else None)
     if len(attrs) > 0:
         clsdict["__init__"] = create_init(attrs)
     clsobj = type(str(clsname), (Descriptor, ), clsdict)
+    from descriptors.docstrings import docstrings  # large, load on use
     clsobj.__doc__ = docstrings.get(clsname)
     return clsobj
 
 
-# create all descriptors classes from funcs and put them in this module
-desc_dict = {
-    name: make_class(name, func, attrs) for name, func, attrs in funcs}
-globals().update(desc_dict)
+funcs_by_name = OrderedDict(
+    (name, (func, attrs)) for name, func, attrs in funcs)
+
+
+def __getattr__(name):
+    """Create the descriptor class called name on first access and put
+    it in this module, so importing the package doesn't create classes
+    that are never used.
+
+    """
+    try:
+        func, attrs = funcs_by_name[name]
+    except KeyError:
+        raise AttributeError(
+            "module {} has no attribute {}".format(__name__, name))
+    # if several threads create the class at once, all get the first
+    return globals().setdefault(name, make_class(name, func, attrs))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(funcs_by_name))
+
+
+def descriptor_classes():
+    """Return a dict mapping the names of all descriptor classes in
+    this module to the classes, creating those that don't exist yet.
+
+    """
+    return OrderedDict(
+        (name, globals().get(name) or __getattr__(name))
+        for name in funcs_by_name)
+
+
+if sys.version_info < (3, 7):  # no module __getattr__, create them now
+    globals().update(descriptor_classes())
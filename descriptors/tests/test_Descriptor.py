@@ -2,9 +2,11 @@ from __future__ import print_function, unicode_literals, division
 
 import unittest
 import os
+import pickle
 from itertools import product
 
-from descriptors import Descriptor, Validated
+from descriptors import (
+    Descriptor, Validated, ValidationError, All, Any, Memoized)
 from descriptors import _all_descriptors
 globals().update(_all_descriptors)
 
@@ -55,6 +57,197 @@ class DescriptorTest(unittest.TestCase):
         self.set_assert(a, [1, 7, 11, 41])
         self.try_set(a, "This is not a string.")
 
+    def test_subclass_setters(self):
+        """Test that the setters of descriptor subclasses run the
+        checks of all their autoset base classes, in order, and store
+        the value once.
+
+        """
+        calls = []
+
+        class Even(Int):
+            def __set__(self, instance, value, name=None):
+                calls.append("Even")
+                if value % 2:
+                    raise ValueError(self.err_msg(instance, value))
+
+        class Small(Even):
+            def __set__(self, instance, value, name=None):
+                calls.append("Small")
+                if value > 10:
+                    raise ValueError(self.err_msg(instance, value))
+
+        class Inherited(Small):
+            pass
+
+        class A(Validated):
+            f = Small()
+            g = Inherited()
+
+        self.assertEqual(Small._set_checks[1:], Even._set_checks)
+        a = A()
+        self.set_assert(a, 4)
+        self.assertEqual(calls, ["Small", "Even"])
+        self.try_set(a, 12)
+        self.try_set(a, 3)
+        self.try_set(a, 4.0)
+        self.set_assert(a, 8, "g")
+        self.try_set(a, 8.0, "g")
+
+    def test_or_nested(self):
+        class A(Validated):
+            f = Int() & (GreaterThan(9) | LessThan(-9))
+            g = Satisfies(lambda x: int(x) > 0) | Str()
+
+        a = A()
+        self.set_assert(a, 10)
+        self.set_assert(a, -10)
+        self.try_set(a, 7)
+        self.try_set(a, 10.0)
+        self.set_assert(a, "-7", "g")
+        # only failed checks are caught, not other errors
+        with self.assertRaises(ValueError) as ctx:
+            a.g = b"seven"
+        self.assertFalse(isinstance(ctx.exception, ValidationError))
+
+    def test_flattened_composition(self):
+        f = Int() & Positive() & (LessThan(3) | GreaterThan(9) | Bool())
+        self.assertTrue(isinstance(f, All))
+        self.assertEqual(len(f.descriptors), 3)
+        self.assertTrue(isinstance(f.descriptors[2], Any))
+        self.assertEqual(len(f.descriptors[2].descriptors), 3)
+        self.assertEqual(
+            f.field_type,
+            "Int_AND_Positive_AND_LessThan(3)_OR_GreaterThan(9)_OR_Bool")
+
+        class A(Validated):
+            g = Apply(str.strip) & Apply(str.lower) & Length(3) & Str()
+
+        self.assertEqual(A.__dict__["g"].descriptors[2].name, "g")
+        a = A()
+        a.g = str(" ABC ")
+        self.assertEqual(a.g, "abc")
+        self.assertEqual(A.__dict__["g"].validate(a, str("XyZ ")), "xyz")
+        self.assertEqual(a.g, "abc")
+        self.try_set(a, str("abcd"), "g")
+        self.assertEqual(a.g, "abc")
+
+    def test_no_autoset_composition(self):
+        class Double(Descriptor):
+            no_autoset = True
+
+            def __set__(self, instance, value, name=None):
+                super(Double, self).__set__(instance, value * 2, name)
+
+        class A(Validated):
+            f = Double() & Int()
+            g = Double()
+
+        a = A()
+        a.f = 4
+        self.assertEqual(a.f, 8)
+        a.g = "ab"
+        self.assertEqual(a.g, "abab")
+        self.try_set(a, "ab")
+
+    def test_validation_error(self):
+        reprs = []
+
+        class Value(object):
+            def __str__(self):
+                reprs.append(self)
+                return "Value()"
+
+        class A(Validated):
+            f = Int()
+
+        a = A()
+        value = Value()
+        with self.assertRaises(ValidationError) as ctx:
+            a.f = value
+        e = ctx.exception
+        self.assertTrue(isinstance(e, ValueError))
+        self.assertEqual(reprs, [])
+        self.assertTrue(e.descriptor is A.__dict__["f"])
+        self.assertTrue(e.instance_cls is A)
+        self.assertEqual(e.name, "f")
+        self.assertTrue(e.value is value)
+        self.assertEqual(
+            repr(e), "<ValidationError: Int attribute A.f, Value value>")
+        self.assertEqual(reprs, [])
+        self.assertEqual(
+            str(e),
+            "Attempted to set the Int attribute A.f to the Value value "
+            "Value(), which does not satisfy the condition Int.")
+        self.assertEqual(reprs, [value])
+        self.assertEqual(
+            A.__dict__["f"].err_msg(a, value), str(e))
+
+    def test_pickle(self):
+        from descriptors.utils import PathCache, default_path_cache
+        descs = [
+            Positive(), InRange(1, 3), In([1, 2]), RegexMatch("a+"),
+            Apply(abs), ExistingPath(cache=True), MadePath(),
+            Int() & Positive(), Int() | (Str() & NotRegexMatch("b"))]
+        for desc in descs:
+            copy = pickle.loads(pickle.dumps(desc))
+            self.assertTrue(copy.__class__ is desc.__class__)
+            self.assertEqual(copy.field_type, desc.field_type)
+        self.assertTrue(
+            pickle.loads(pickle.dumps(default_path_cache))
+            is default_path_cache)
+        cache = pickle.loads(pickle.dumps(PathCache(maxsize=3, ttl=1)))
+        self.assertEqual((cache.maxsize, cache.ttl, len(cache)), (3, 1, 0))
+
+        class A(Validated):
+            f = Int() | Float()
+
+        a = A()
+        copy = pickle.loads(pickle.dumps(A.f))
+        copy.bind("f")
+        copy.__set__(a, 2.5)
+        self.assertEqual(a.f, 2.5)
+        self.assertRaises(ValidationError, copy.__set__, a, "2.5")
+
+    def test_memoize(self):
+        calls = []
+
+        def is_code(value):
+            calls.append(value)
+            return value.isupper()
+
+        class A(Validated):
+            f = (Str() & Satisfies(is_code)).memoize(maxsize=2)
+            g = Apply(float).memoize()
+            h = Memoized(Float() | List())
+
+        a = A()
+        for value in ("DE", "DE", "fr", "DE", "fr"):
+            try:
+                a.f = value
+            except ValidationError as e:
+                self.assertTrue(e.descriptor is A.f)
+                self.assertTrue(" attribute A.f to " in str(e))
+        self.assertEqual(calls, ["DE", "fr"])
+        self.assertEqual(A.f.cache_info(), (3, 2, 0, 2, 2))
+        a.f = "US"
+        self.assertEqual(A.f.cache_info().evictions, 1)
+        a.g = "1.5"
+        a.g = "1.5"
+        self.assertEqual(a.g, 1.5)
+        self.assertEqual(A.g.cache_info()[:2], (1, 1))
+        a.h = 1.0
+        self.assertRaises(ValidationError, setattr, a, "h", 1)
+        a.h = [1]
+        a.h = [1]
+        self.assertEqual(A.h.cache_info()[:2], (0, 2))
+        A.f.cache_clear()
+        self.assertEqual(A.f.cache_info(), (0, 0, 0, 2, 0))
+        self.assertRaises(ValueError, Memoized, Int(), 0)
+        copy = pickle.loads(pickle.dumps(A.h))
+        self.assertEqual(copy.cache_info(), (0, 0, 0, 1024, 0))
+        self.assertEqual(copy.validate(a, 2.5), 2.5)
+
     def test_all_binary_compositions(self):
         """Test AND and OR composition of all pairwise combinations
         of Descriptor instances.
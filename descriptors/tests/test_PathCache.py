@@ -0,0 +1,137 @@
+from __future__ import print_function, unicode_literals, division
+
+import os
+import shutil
+import unittest
+from tempfile import mkdtemp
+
+from descriptors import Validated, ExistingPath, MadePath
+from descriptors.utils import PathCache, default_path_cache
+from descriptors.utils.PathCache import (
+    exists_by_scanning, exists_concurrently)
+
+
+class PathCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = mkdtemp()
+        self.stats = []
+        exists = os.path.exists
+
+        def counting_exists(path):
+            self.stats.append(path)
+            return exists(path)
+        os.path.exists = counting_exists
+        self.addCleanup(setattr, os.path, "exists", exists)
+        self.addCleanup(shutil.rmtree, self.tmp)
+
+    def test_cached(self):
+        cache = PathCache()
+        self.assertTrue(cache.exists(self.tmp))
+        self.assertTrue(cache.exists(self.tmp))
+        self.assertEqual(self.stats, [self.tmp])
+        missing = os.path.join(self.tmp, "missing")
+        self.assertFalse(cache.exists(missing))
+        os.mkdir(missing)
+        self.assertFalse(cache.exists(missing))
+        cache.invalidate(missing)
+        self.assertTrue(cache.exists(missing))
+        cache.invalidate()
+        self.assertEqual(len(cache), 0)
+
+    def test_ttl(self):
+        cache = PathCache(ttl=0)
+        cache.exists(self.tmp)
+        cache.exists(self.tmp)
+        self.assertEqual(self.stats, [self.tmp] * 2)
+
+    def test_maxsize(self):
+        cache = PathCache(maxsize=2)
+        paths = [os.path.join(self.tmp, str(i)) for i in range(3)]
+        for path in paths + paths[1:]:
+            cache.exists(path)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(self.stats, paths)
+        cache.exists(paths[0])
+        self.assertEqual(self.stats, paths + paths[:1])
+        with self.assertRaises(ValueError):
+            PathCache(maxsize=0)
+
+    def test_descriptors(self):
+        cache = PathCache()
+
+        class A(Validated):
+            f = ExistingPath(cache=cache)
+            g = MadePath(cache=cache)
+            h = ExistingPath(cache=True)
+
+        self.assertTrue(A.h.cache is default_path_cache)
+        a, b = A(), A()
+        made = os.path.join(self.tmp, "made")
+        a.g = made
+        self.assertTrue(os.path.isdir(made))
+        del self.stats[:]
+        b.g = made
+        a.f = made
+        b.f = made
+        self.assertEqual(self.stats, [])
+        with self.assertRaises(ValueError):
+            a.f = os.path.join(self.tmp, "missing")
+
+    def test_exists_by_scanning(self):
+        tmp = self.tmp
+        for name in ("a", "b"):
+            os.mkdir(os.path.join(tmp, name))
+        open(os.path.join(tmp, "a", "file"), "w").close()
+        paths = [
+            os.path.join(tmp, "a"), os.path.join(tmp, "b"),
+            os.path.join(tmp, "c"), os.path.join(tmp, "a", "file"),
+            os.path.join(tmp, "a", "file", ""),
+            os.path.join(tmp, "a", "file", "x"),
+            os.path.join(tmp, "a", ".."), os.path.join(tmp, "c", "x"),
+            os.path.join(tmp, "c", "y")]
+        if hasattr(os, "symlink"):
+            os.symlink(
+                os.path.join(tmp, "missing"), os.path.join(tmp, "broken"))
+            os.symlink(os.path.join(tmp, "a"), os.path.join(tmp, "link"))
+            paths += [os.path.join(tmp, "broken"), os.path.join(tmp, "link")]
+        expected = dict((path, os.path.exists(path)) for path in paths)
+        del self.stats[:]
+        self.assertEqual(exists_by_scanning(paths), expected)
+        # one stat each for the trailing separator, "..", the lone
+        # paths in a and a/file and the two symbolic links
+        self.assertTrue(len(self.stats) <= 6)
+
+    def test_batch_descriptors(self):
+        cache = PathCache()
+        existing, made = ExistingPath(cache=cache), MadePath(cache=cache)
+        paths = [os.path.join(self.tmp, str(i)) for i in range(10)]
+        self.assertEqual(
+            ExistingPath().check_paths(paths),
+            dict((path, False) for path in paths))
+        made.make_paths(paths)
+        self.assertTrue(all(os.path.isdir(path) for path in paths))
+        del self.stats[:]
+        self.assertEqual(
+            existing.check_paths(paths), dict((path, True) for path in paths))
+        for path in paths:
+            existing.validate(None, path)
+        self.assertEqual(self.stats, [])
+
+    def test_exists_concurrently(self):
+        paths = [os.path.join(self.tmp, str(i)) for i in range(20)]
+        for path in paths[::2]:
+            os.mkdir(path)
+        expected = dict((path, os.path.exists(path)) for path in paths)
+        self.assertEqual(exists_concurrently(paths, workers=4), expected)
+        cache = PathCache()
+        self.assertEqual(
+            ExistingPath(cache=cache).check_paths(paths, workers=4), expected)
+        self.assertEqual(len(cache), len(paths))
+
+
+def main():
+    unittest.main()
+
+if __name__ == "__main__":
+    main()
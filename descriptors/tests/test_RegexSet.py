@@ -0,0 +1,73 @@
+from __future__ import print_function, unicode_literals, division
+
+import pickle
+import re
+import unittest
+
+from descriptors import (
+    Validated, ValidationError, RegexMatch, NotRegexMatch, Str, All, Any)
+from descriptors.utils import RegexSet, compile_pattern
+from descriptors.utils.RegexSet import required_literal
+
+
+class RegexSetTest(unittest.TestCase):
+
+    def test_compile_pattern(self):
+        self.assertTrue(compile_pattern(r"a\d+") is compile_pattern(r"a\d+"))
+        self.assertTrue(
+            compile_pattern("a", re.I) is not compile_pattern("a"))
+        self.assertTrue(
+            RegexMatch(r"x\w").pattern is NotRegexMatch(r"x\w").pattern)
+
+    def test_required_literal(self):
+        cases = [
+            (r"\bfailed\d+", "failed"), (r"^ERROR: (.*)$", "ERROR: "),
+            (r"(foo|bar)baz", "baz"), (r"a|bcd", None), (r"x*", None),
+            (r"(?x) a b  c", "abc")]
+        for regex, literal in cases:
+            self.assertEqual(required_literal(re.compile(regex)), literal)
+        self.assertEqual(required_literal(re.compile("abc", re.I)), None)
+
+    def test_search(self):
+        regexes = RegexSet(
+            [r"^ERROR", r"Traceback", r"\bfailed\b", re.compile("(?i)oops")])
+        self.assertEqual(len(regexes), 4)
+        self.assertEqual(regexes.search("job 12 failed"), 2)
+        self.assertEqual(regexes.search("job 12 failedx"), None)
+        self.assertEqual(regexes.search("OOPS"), 3)
+        self.assertEqual(regexes.search("INFO ERROR"), None)
+        self.assertEqual(
+            regexes.matches("ERROR Traceback: oops, failed"), [0, 1, 2, 3])
+        self.assertEqual(regexes.matches("fine"), [])
+
+    def test_composition(self):
+        banned = [NotRegexMatch(r"\bdrop\b"), NotRegexMatch(r"--\s*$")]
+
+        class A(Validated):
+            f = Str() & All(banned)
+            g = RegexMatch(r"^\d+$") | RegexMatch(r"^0x[0-9a-f]+$")
+
+        a = A()
+        self.assertEqual(len(A.f.validators), 2)
+        self.assertEqual(len(A.g.validators), 1)
+        a.f = "select 1"
+        a.g = "0x1f"
+        a.g = "31"
+        for value in ("drop table", "select 1 -- "):
+            self.assertRaises(ValidationError, setattr, a, "f", value)
+        self.assertRaises(ValidationError, setattr, a, "g", "0x1g")
+        self.assertEqual(A.f.validators[1](a, "1 -- 2"), "1 -- 2")
+        with self.assertRaises(ValidationError) as ctx:
+            A.f.validators[1](a, "drop it")
+        self.assertTrue(ctx.exception.descriptor is banned[0])
+        copy = pickle.loads(pickle.dumps(A.g))
+        self.assertEqual(len(copy.validators), 1)
+        self.assertEqual(copy.validate(a, "12"), "12")
+        self.assertRaises(ValidationError, copy.validate, a, "x")
+
+
+def main():
+    unittest.main()
+
+if __name__ == "__main__":
+    main()
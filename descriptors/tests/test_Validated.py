@@ -0,0 +1,567 @@
+from __future__ import print_function, unicode_literals, division
+
+import copy
+import pickle
+import unittest
+
+import descriptors
+from descriptors import (
+    Validated, ValidationError, ValidationErrors, Int, Str, Float, List,
+    Positive, InRange, LessThan, MinLength, NotNone, HasAttr, In,
+    RegexMatch, NotRegexMatch, Apply, EitherOr, Satisfies)
+
+
+# defined at the top level so they can be pickled
+class Record(Validated):
+    f = Int() & Positive()
+    g = Int() | Satisfies(lambda x: x.islower())
+
+
+class SlottedRecord(Validated):
+    use_slots = True
+    f = Int() & Positive()
+
+
+class SlottedComposedRecord(Validated):
+    use_slots = True
+    f = RegexMatch("a") | RegexMatch("b")
+    g = Int().memoize()
+
+
+class ValidatedTest(unittest.TestCase):
+
+    def test_isinstance(self):
+        class A(Validated):
+            f = Int()
+
+        a = A()
+        self.assertTrue(isinstance(a, A))
+        self.assertTrue(a.__class__ is A)
+        self.assertTrue(type(A()) is type(a))
+
+    def test_init_called_once(self):
+        calls = []
+
+        class A(Validated):
+            f = Int()
+
+            def __init__(self, f):
+                calls.append(f)
+                self.f = f
+
+        a = A(7)
+        self.assertEqual(a.f, 7)
+        self.assertEqual(calls, [7])
+        with self.assertRaises(ValueError):
+            A("seven")
+
+    def test_fields(self):
+        class A(Validated):
+            f = Int()
+            g = Str()
+            x = 0
+
+        class B(A):
+            h = Positive()
+            g = None
+
+        self.assertEqual(list(A._fields), ["f", "g"])
+        self.assertEqual(list(B._fields), ["f", "h"])
+        self.assertEqual(A._fields["g"].name, "g")
+        b = B()
+        b.h = 1
+        with self.assertRaises(ValueError):
+            b.f = "1"
+
+    def test_from_dict(self):
+        class A(Validated):
+            f = Int()
+            g = Str() & Apply(str.upper)
+            h = Positive()
+
+            def __init__(self):
+                raise AssertionError("from_dict must not call __init__")
+
+        a = A.from_dict({"f": 7, "g": "seven", "x": None})
+        self.assertTrue(isinstance(a, A))
+        self.assertEqual((a.f, a.g, a.x), (7, "SEVEN", None))
+        self.assertFalse(hasattr(a, "h"))
+        with self.assertRaises(ValidationErrors) as ctx:
+            A.from_dict({"f": "7", "g": 7, "h": 1})
+        errors = ctx.exception.errors
+        self.assertEqual([e.name for e in errors], ["f", "g"])
+        self.assertEqual(
+            str(ctx.exception), "\n".join(str(e) for e in errors))
+
+    def test_from_dict_cross_field(self):
+        class A(Validated):
+            f = EitherOr("g")
+            g = EitherOr("f")
+
+        a = A.from_dict({"f": True, "g": None})
+        self.assertEqual((a.f, a.g), (True, None))
+        with self.assertRaises(ValidationErrors):
+            A.from_dict({"f": True, "g": True})
+
+    def test_validate_many(self):
+        class A(Validated):
+            f = Int()
+
+        rows = [{"f": 1}, {"f": "2"}, {"f": 3}]
+        with self.assertRaises(ValueError):
+            A.validate_many(rows, on_error="ignore")
+        many = A.validate_many(rows)
+        self.assertEqual(next(many).f, 1)
+        with self.assertRaises(ValidationErrors):
+            next(many)
+        self.assertEqual(
+            [a.f for a in A.validate_many(rows, on_error="skip")], [1, 3])
+        results = list(A.validate_many(rows, on_error="yield"))
+        self.assertTrue(isinstance(results[1], ValidationErrors))
+        self.assertEqual(results[2].f, 3)
+
+    def test_validate_many_threaded(self):
+        class A(Validated):
+            f = Int()
+
+        rows = [{"f": i} for i in range(50)] + [{"f": "50"}]
+        results = list(A.validate_many(rows, on_error="yield", workers=4))
+        self.assertEqual([a.f for a in results[:-1]], list(range(50)))
+        self.assertTrue(isinstance(results[-1], ValidationErrors))
+        with self.assertRaises(ValidationErrors):
+            list(A.validate_many(rows, workers=4))
+
+    def test_validate_stream(self):
+        rows = [{"f": i, "g": "x"} for i in range(1, 40)] + [{"f": -1}]
+        results = list(Record.validate_stream(
+            rows, workers=2, chunksize=7, on_error="yield"))
+        self.assertEqual([r.f for r in results[:-1]], list(range(1, 40)))
+        errors = results[-1]
+        self.assertTrue(isinstance(errors, ValidationErrors))
+        self.assertTrue(errors.errors[0].descriptor is Record.f)
+        self.assertTrue("Record.f" in str(errors))
+        with self.assertRaises(ValidationErrors):
+            list(Record.validate_stream(rows, workers=2, chunksize=7))
+        rows = [{"f": i} for i in range(-3, 30)]
+        self.assertEqual(
+            [r.f for r in SlottedRecord.validate_stream(
+                rows, workers=2, on_error="skip")],
+            list(range(1, 30)))
+
+    def test_pickle(self):
+        record = Record.from_dict({"f": 1, "g": 7})
+        self.assertEqual(pickle.loads(pickle.dumps(record)).g, 7)
+        slotted = pickle.loads(pickle.dumps(SlottedRecord.from_dict({"f": 1})))
+        self.assertEqual(slotted.f, 1)
+        with self.assertRaises(ValidationError):
+            slotted.f = 0
+        desc = pickle.loads(pickle.dumps(SlottedRecord.f))
+        self.assertTrue(desc.__class__ is SlottedRecord.f.__class__)
+        # composed and memoized descriptors pickle their own state
+        slotted = pickle.loads(pickle.dumps(
+            SlottedComposedRecord.from_dict({"f": "b", "g": 3})))
+        self.assertEqual((slotted.f, slotted.g), ("b", 3))
+        for name in ("f", "g"):
+            desc = getattr(SlottedComposedRecord, name)
+            restored = pickle.loads(pickle.dumps(desc))
+            self.assertTrue(restored.__class__ is desc.__class__)
+            with self.assertRaises(ValidationError):
+                restored.__set__(slotted, "c")
+        try:
+            record.g = "X"
+        except ValidationError as e:
+            error = pickle.loads(pickle.dumps(e))
+        self.assertTrue(error.descriptor is Record.g)
+        self.assertEqual(error.value, "X")
+
+    def test_compile_schema(self):
+        def fields():
+            return dict(
+                f=Int() & Positive(),
+                g=Str() & (RegexMatch(r"^ab+$") | RegexMatch(r"x-\d")),
+                h=Apply(int),
+                i=InRange(-1.5, 3) | Str(),
+                j=(Float() | List()) & MinLength(0) | HasAttr("real"),
+                k=NotRegexMatch(r"\bdrop\b") & Satisfies(callable) | NotNone(),
+                m=In([1, 2]) | LessThan(-7))
+
+        plain = type(str("Plain"), (Validated, ), fields())
+        compiled_fields = fields()
+        compiled_fields["compile_schema"] = True
+        Compiled = type(str("Compiled"), (Validated, ), compiled_fields)
+        values = [
+            0, 1, -8, 2.5, -1.5, 3, "abb", "x-1", "drop", "b x-", [], [1],
+            None, True, "7", str]
+        for name in sorted(plain._fields):
+            for value in values:
+                mapping = {name: value, "extra": 1}
+                try:
+                    expected = plain._from_dict(mapping)
+                except (TypeError, ValueError) as e:
+                    self.assertRaises(
+                        e.__class__, Compiled._from_dict, mapping)
+                    continue
+                obj, errors = Compiled._from_dict(mapping)
+                self.assertTrue(obj.__class__ is Compiled)
+                if errors is None:
+                    self.assertTrue(expected[1] is None)
+                    self.assertEqual(obj.__dict__, expected[0].__dict__)
+                else:
+                    self.assertEqual(
+                        [e.name for e in errors],
+                        [e.name for e in expected[1]])
+                    self.assertTrue(
+                        errors[0].descriptor is Compiled._fields[name])
+
+    def test_compile_schema_inheritance(self):
+        class A(Validated):
+            compile_schema = True
+            use_slots = True
+            f = Int()
+
+        class B(A):
+            g = Str() & RegexMatch("a")
+
+        class C(B):
+            compile_schema = False
+            h = Positive()
+
+        b = B.from_dict({"f": 1, "g": "abc"})
+        self.assertEqual((b.f, b.g), (1, "abc"))
+        self.assertFalse("obj_dict" in B._from_dict.source)
+        with self.assertRaises(ValidationErrors):
+            B.from_dict({"f": "1", "g": "bc"})
+        self.assertEqual(C.from_dict({"h": 1}).__class__, C)
+        self.assertFalse(hasattr(C._from_dict, "source"))
+        with self.assertRaises(ValidationErrors):
+            C.from_dict({"h": 0})
+
+    def test_slots(self):
+        class A(Validated):
+            use_slots = True
+            f = Int()
+            g = Str() & Apply(str.upper)
+
+        class B(A):
+            h = Positive()
+
+        for cls in (A, B):
+            a = cls()
+            self.assertFalse(hasattr(a, "__dict__"))
+            a.f = 7
+            a.g = "seven"
+            self.assertEqual((a.f, a.g), (7, "SEVEN"))
+            with self.assertRaises(ValueError):
+                a.f = "7"
+            with self.assertRaises(AttributeError):
+                a.x = None
+            del a.f
+            self.assertFalse(hasattr(a, "f"))
+        b = B.from_dict({"f": 1, "g": "one", "h": 1})
+        self.assertEqual((b.f, b.g, b.h), (1, "ONE", 1))
+        # keys that aren't fields are ignored without a __dict__
+        C = type(str("C"), (B, ), {"compile_schema": True})
+        for cls in (B, C):
+            b = cls.from_dict({"f": 1, "x": 2})
+            self.assertEqual(b.f, 1)
+            self.assertFalse(hasattr(b, "x"))
+        self.assertTrue(isinstance(A.f, Int))
+        self.assertEqual(repr(A.f).split()[:2], ["<Descriptor:", "Int"])
+        with self.assertRaises(AttributeError) as cm:
+            A().f
+        self.assertEqual(str(cm.exception), "f")
+
+    def test_slots_shared_descriptor(self):
+        positive = Positive()
+
+        class A(Validated):
+            x = positive
+
+        class B(Validated):
+            use_slots = True
+            x = positive
+
+        class C(Validated):
+            use_slots = True
+            y = positive
+
+        for cls, name in ((A, "x"), (B, "x"), (C, "y")):
+            obj = cls()
+            setattr(obj, name, 1)
+            self.assertEqual(getattr(obj, name), 1)
+            with self.assertRaises(ValueError):
+                setattr(obj, name, -1)
+            obj = cls.from_dict({name: 2})
+            self.assertEqual(getattr(obj, name), 2)
+        self.assertTrue(A.x is positive)
+        self.assertFalse(hasattr(positive, "slot"))
+
+    def test_class_access(self):
+        class A(Validated):
+            f = Int()
+
+        self.assertTrue(A.f is A.__dict__["f"])
+        with self.assertRaises(AttributeError):
+            A().f
+
+    def test_fast_reads(self):
+        class A(Validated):
+            fast_reads = True
+            f = Int()
+            g = Str() & Apply(str.upper)
+
+        class B(A):
+            h = Positive()
+
+        self.assertFalse("f" in A.__dict__)
+        self.assertTrue(A.f is A._fields["f"])
+        self.assertEqual(B.g.name, "g")
+        with self.assertRaises(AttributeError):
+            A.x
+        for cls in (A, B):
+            a = cls()
+            with self.assertRaises(AttributeError):
+                a.f
+            a.f = 7
+            a.g = "seven"
+            a.x = "x"
+            self.assertEqual((a.f, a.g, a.x), (7, "SEVEN", "x"))
+            with self.assertRaises(ValueError):
+                a.f = "7"
+            del a.f
+            self.assertFalse(hasattr(a, "f"))
+        b = B()
+        with self.assertRaises(ValueError):
+            b.h = -1
+        b = B.from_dict({"f": 1, "g": "one", "h": 1})
+        self.assertEqual((b.f, b.g, b.h), (1, "ONE", 1))
+
+    def test_fast_reads_conflicts(self):
+        with self.assertRaises(TypeError):
+            class A(Validated):
+                fast_reads = True
+                use_slots = True
+        with self.assertRaises(TypeError):
+            class B(Validated):
+                fast_reads = True
+
+                def __setattr__(self, name, value):
+                    pass
+
+    def test_set_sampling(self):
+        calls = []
+
+        def odd(x):
+            calls.append(x)
+            return x % 2
+
+        for options in (
+                {}, {"use_slots": True}, {"fast_reads": True},
+                {"compile_schema": True}):
+            A = type(str("A"), (Validated, ), dict(
+                options, f=Satisfies(odd), g=Int()))
+
+            def failures(values, attr="f"):
+                count = 0
+                a = A()
+                for value in values:
+                    try:
+                        setattr(a, attr, value)
+                    except ValidationError:
+                        count += 1
+                    else:
+                        self.assertEqual(getattr(a, attr), value)
+                return count
+
+            A.set_sampling(0.25)
+            self.assertEqual(failures([2] * 100), 25)
+            self.assertEqual(failures(["7"] * 8, "g"), 2)
+            A.set_sampling(0)
+            self.assertEqual(failures([2] * 100), 0)
+            self.assertEqual(A.from_dict({"f": 4, "g": "7"}).g, "7")
+            A.set_sampling(fields=["f"], once=True)
+            del calls[:]
+            self.assertEqual(failures([1, 2, 1, 2]), 2)
+            self.assertEqual(calls, [1, 2])
+            self.assertEqual(failures(["7"], "g"), 0)
+            A.set_sampling()
+            self.assertEqual(failures(["7"] * 5, "g"), 5)
+            with self.assertRaises(ValidationErrors):
+                A.from_dict({"f": 4, "g": "7"})
+            self.assertEqual(failures([2] * 10), 10)
+            self.assertFalse(A._unsampled)
+            with self.assertRaises(ValueError):
+                A.set_sampling(fields=["h"])
+            with self.assertRaises(ValueError):
+                A.set_sampling(2)
+
+    def test_set_sampling_refused(self):
+        class A(Validated):
+            f = EitherOr("g")
+            g = EitherOr("f")
+            h = Int() & Apply(str)
+            i = Int()
+
+        # converting fields would store unconverted values, and fields
+        # depending on other attributes can't be cached by value
+        for kwargs in ({"fraction": 0.5}, {"fields": ["h"], "fraction": 0},
+                       {"once": True}, {"fields": ["f"], "once": True}):
+            with self.assertRaises(ValueError):
+                A.set_sampling(**kwargs)
+            self.assertFalse(A.__dict__.get("_unsampled"))
+        A.set_sampling(fields=["f", "g", "i"], fraction=0.5)
+        A.set_sampling(fields=["h", "i"], once=True)
+        a = A()
+        a.h = 3
+        a.h = 3
+        self.assertEqual(a.h, "3")
+        a.g = 1
+        b = A()
+        b.f = 1
+        A.set_sampling()
+        self.assertFalse(A._unsampled)
+
+    def test_set_sampling_subclasses(self):
+        class P(Validated):
+            x = Int()
+
+        class Q(P):
+            y = Int()
+
+        class R(Q):
+            x = Str()  # overrides P.x
+
+        P.set_sampling(0)
+
+        class S(P):
+            pass
+
+        S.set_sampling()
+        with self.assertRaises(ValueError):
+            S().x = "s"
+        q, r = Q(), R()
+        q.x = "s"
+        self.assertEqual(Q.from_dict({"x": "s"}).x, "s")
+        with self.assertRaises(ValueError):
+            q.y = "s"
+        with self.assertRaises(ValueError):
+            r.x = 1
+        with self.assertRaises(ValidationErrors):
+            R.from_dict({"x": 1})
+        Q.set_sampling(fields=["x"])
+        with self.assertRaises(ValueError):
+            q.x = "s"
+        P().x = "s"
+        P.set_sampling()
+        for cls in (P, Q):
+            with self.assertRaises(ValidationErrors):
+                cls.from_dict({"x": "s"})
+
+    def test_disable_validation(self):
+        class A(Validated):
+            f = Int()
+
+        class B(Validated):
+            use_slots = True
+            g = Int()
+
+        descriptors.disable_validation()
+        try:
+            class C(A):
+                fast_reads = True
+                h = Int()
+
+            a, b, c = A(), B(), C()
+            a.f = b.g = c.f = c.h = "7"
+            self.assertEqual((a.f, b.g, c.f, c.h), ("7", ) * 4)
+            self.assertEqual(C.from_dict({"f": "7"}).f, "7")
+            with self.assertRaises(RuntimeError):
+                A.set_sampling(0.5)
+        finally:
+            descriptors.enable_validation()
+        for obj, attr in ((a, "f"), (b, "g"), (c, "f"), (c, "h")):
+            with self.assertRaises(ValueError):
+                setattr(obj, attr, "7")
+        self.assertTrue(C.__dict__.get("f") is None)
+
+    def test_batch(self):
+        for options in ({}, {"use_slots": True}, {"fast_reads": True}):
+            base = type(str("Base"), (Validated, ), dict(
+                options, f=EitherOr("g"), g=EitherOr("f"),
+                h=Apply(int), i=Int(), j=Satisfies(lambda x: x % 2)))
+            # a subclass without slots, whose instances have a __dict__
+            # for the other attributes
+            A = type(str("A"), (base, ), {"use_slots": False})
+            a = A()
+            a.g = True
+            a.h = "1"
+            with a.batch():
+                a.f = True
+                a.g = None
+                a.h = "7"
+                a.x = "x"
+                with a.batch():  # part of the outer batch
+                    a.i = 7
+                self.assertEqual(a.h, "7")
+            self.assertTrue(a.__class__ is A)
+            self.assertEqual(
+                (a.f, a.g, a.h, a.i, a.x), (True, None, 7, 7, "x"))
+
+            with self.assertRaises(ValidationErrors) as cm:
+                with a.batch():
+                    a.g = True
+                    a.h = "8"
+                    a.i = "7"
+                    a.y = "y"
+            self.assertEqual(
+                sorted(e.descriptor.name for e in cm.exception.errors),
+                ["g", "i"])
+            self.assertEqual(
+                (a.f, a.g, a.h, a.i, a.x), (True, None, 7, 7, "x"))
+            self.assertFalse(hasattr(a, "y"))
+
+            # disabling validation leaves the batch variant of A alone
+            descriptors.disable_validation()
+            descriptors.enable_validation()
+            a.f = None
+            a.g = True
+            with a.batch():
+                a.f = True
+                a.g = None
+            self.assertEqual((a.f, a.g), (True, None))
+
+            b = A()
+            with self.assertRaises(KeyError):
+                with b.batch():
+                    b.i = 7
+                    raise KeyError
+            self.assertFalse(hasattr(b, "i"))
+            with self.assertRaises(ValueError):
+                b.i = "7"
+            # checks raising other exceptions roll the batch back too
+            with self.assertRaises(TypeError):
+                with b.batch():
+                    b.i = 7
+                    b.j = "s"
+            self.assertFalse(hasattr(b, "i") or hasattr(b, "j"))
+
+    def test_batch_pickle(self):
+        for obj in (Record.from_dict({"f": 1, "g": 7}),
+                    SlottedRecord.from_dict({"f": 1})):
+            cls = obj.__class__
+            with obj.batch():
+                obj.f = 2
+                self.assertFalse(type(obj) is cls)
+                copies = [pickle.loads(pickle.dumps(obj)), copy.copy(obj)]
+            for other in copies:
+                self.assertTrue(other.__class__ is cls)
+                self.assertEqual(other.f, 2)
+                with self.assertRaises(ValidationError):
+                    other.f = 0
+
+
+def main():
+    unittest.main()
+
+if __name__ == "__main__":
+    main()
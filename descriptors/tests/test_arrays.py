@@ -0,0 +1,69 @@
+from __future__ import print_function, unicode_literals, division
+
+import unittest
+
+from descriptors import (
+    Int, Float, Str, List, InRange, Positive, LessThan, GreaterThan,
+    Satisfies, Apply, EitherOr)
+from descriptors.arrays import np
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class ArrayTest(unittest.TestCase):
+
+    def assert_mask(self, desc, values, expected):
+        mask = desc.validate_array(values)
+        self.assertEqual(mask.dtype, bool)
+        self.assertEqual(mask.tolist(), expected)
+
+    def test_ranges(self):
+        values = np.array([-2, 0, 1, 3, 4, 7])
+        self.assert_mask(
+            InRange(1, 4), values, [False, False, True, True, True, False])
+        self.assert_mask(
+            Positive(), values, [False, False, True, True, True, True])
+        self.assertEqual(
+            InRange(1, 4).validate_array(values, indices=True).tolist(),
+            [0, 1, 5])
+        indices = Positive().validate_array([[1, -1], [0, 2]], indices=True)
+        self.assertEqual(indices.tolist(), [[0, 1], [1, 0]])
+
+    def test_builtin_types(self):
+        ints = np.arange(3)
+        self.assert_mask(Int(), ints, [True] * 3)
+        self.assert_mask(
+            Int(), np.array([1, 2], dtype=np.uint8), [True, True])
+        self.assert_mask(Float(), ints, [False] * 3)
+        self.assert_mask(Float(), ints / 2, [True] * 3)
+        self.assert_mask(Str(), np.array(["a", "b"]), [True, True])
+        self.assert_mask(List(), ints, [False] * 3)
+        objects = np.array([1, "a", 2.0, [1]], dtype=object)
+        self.assert_mask(Int(), objects, [True, False, False, False])
+        self.assert_mask(List(), objects, [False, False, False, True])
+
+    def test_compositions(self):
+        values = np.array([-10, 0, 5, 10])
+        self.assertTrue((Int() & Positive()).vectorized)
+        self.assert_mask(
+            Int() & Positive(), values, [False, False, True, True])
+        self.assert_mask(
+            LessThan(-5) | GreaterThan(5), values, [True, False, False, True])
+        self.assert_mask(
+            Int() & (LessThan(-5) | GreaterThan(5)), values / 1,
+            [False] * 4)
+
+    def test_elementwise_fallback(self):
+        self.assertFalse(Satisfies(lambda x: x % 3 == 0).vectorized)
+        self.assert_mask(
+            Satisfies(lambda x: x % 3 == 0), [3, 4, 6], [True, False, True])
+        self.assertFalse((Apply(abs) & Positive()).vectorized)
+        self.assert_mask(
+            Apply(abs) & Positive(), [-1, 0, 1], [True, False, True])
+        self.assert_mask(EitherOr("g"), [1, None], [True, True])
+
+
+def main():
+    unittest.main()
+
+if __name__ == "__main__":
+    main()
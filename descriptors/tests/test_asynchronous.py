@@ -0,0 +1,109 @@
+from __future__ import print_function, unicode_literals, division
+
+import asyncio
+import os
+import time
+import unittest
+
+from descriptors import (
+    Validated, ValidationErrors, Int, Str, Satisfies, NotSatisfies, Apply,
+    ExistingPath, EitherOr)
+
+
+async def is_even(x):
+    await asyncio.sleep(0.01)
+    return x % 2 == 0
+
+
+async def double(x):
+    await asyncio.sleep(0.01)
+    return 2 * x
+
+
+class A(Validated):
+    f = Int() & Satisfies(is_even)
+    g = NotSatisfies(is_even) | Apply(double)
+    h = ExistingPath()
+    i = EitherOr("j")
+    j = EitherOr("i")
+    k = Str()
+    m = (Int() & Satisfies(is_even)).memoize()
+    n = ExistingPath().memoize()
+
+
+class AsynchronousTest(unittest.TestCase):
+
+    def test_avalidate(self):
+        a = asyncio.run(A.avalidate(
+            {"f": 2, "g": 4, "h": os.curdir, "i": 1, "j": None, "x": 0}))
+        self.assertTrue(isinstance(a, A))
+        self.assertEqual(
+            (a.f, a.g, a.h, a.i, a.j, a.x), (2, 8, os.curdir, 1, None, 0))
+        a = asyncio.run(A.avalidate({"g": 3}))
+        self.assertEqual(a.g, 3)
+
+    def test_memoized(self):
+        a = asyncio.run(A.avalidate({"m": 2, "n": os.curdir}))
+        self.assertEqual((a.m, a.n), (2, os.curdir))
+        with self.assertRaises(ValidationErrors):
+            asyncio.run(A.avalidate({"m": 3}))
+        self.assertEqual(A.m.cache_info().currsize, 0)
+        asyncio.run(A.avalidate({"n": os.curdir}))
+        self.assertEqual(A.n.cache_info()[:2], (1, 1))
+
+    def test_errors(self):
+        with self.assertRaises(ValidationErrors) as ctx:
+            asyncio.run(A.avalidate({
+                "f": 3, "g": 1, "h": "fd8gw3t9", "i": 1, "j": 1, "k": 1}))
+        names = [e.name for e in ctx.exception.errors]
+        self.assertEqual(names, ["f", "h", "j", "k"])
+        with self.assertRaises(TypeError):
+            asyncio.run(A.avalidate({"f": 2, "g": "a"}))
+
+    def test_sync_paths(self):
+        # coroutine functions can't be awaited by the synchronous
+        # paths, which used to accept their (truthy) coroutines
+        B = type(str("B"), (Validated, ), {
+            "f": Int() & Satisfies(is_even), "g": NotSatisfies(is_even),
+            "h": Apply(double)})
+        C = type(str("C"), (B, ), {"compile_schema": True})
+        for cls in (B, C):
+            b = cls()
+            for name, value in (("f", 3), ("g", 3), ("h", 3)):
+                with self.assertRaises(TypeError) as cm:
+                    setattr(b, name, value)
+                self.assertTrue("avalidate" in str(cm.exception))
+                with self.assertRaises(TypeError):
+                    cls.from_dict({name: value})
+        b = asyncio.run(C.avalidate({"f": 2, "g": 3, "h": 3}))
+        self.assertEqual((b.f, b.g, b.h), (2, 3, 6))
+
+    def test_slots(self):
+        class S(Validated):
+            use_slots = True
+            f = Int() & Satisfies(is_even)
+
+        s = asyncio.run(S.avalidate({"f": 2, "x": 1}))
+        self.assertEqual(s.f, 2)
+        self.assertFalse(hasattr(s, "x"))
+
+    def test_concurrent(self):
+        async def slow(x):
+            await asyncio.sleep(0.1)
+            return True
+
+        class B(Validated):
+            f = Satisfies(slow)
+            g = Satisfies(slow)
+            h = Satisfies(slow)
+
+        start = time.time()
+        asyncio.run(B.avalidate({"f": 1, "g": 2, "h": 3}))
+        self.assertTrue(time.time() - start < 0.25)
+
+
+def main():
+    unittest.main()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+from __future__ import print_function, unicode_literals, division
+
+import unittest
+
+from descriptors import _all_descriptors
+from descriptors.bench import suite
+
+
+class BenchTest(unittest.TestCase):
+
+    def test_cases(self):
+        cases = suite.cases()
+        for name, _ in _all_descriptors:
+            self.assertTrue("set/{}/valid".format(name) in cases)
+        self.assertTrue("compose/nested/16/invalid" in cases)
+        self.assertTrue("validated/compiled/from_dict/invalid" in cases)
+        # every case runs without raising, valid ones don't swallow
+        # ValidationErrors
+        for name, func in cases.items():
+            func()
+
+    def test_compare(self):
+        baseline = {"results": {"a": 100.0, "b": 100.0, "c": 100.0}}
+        results = {"results": {"a": 95.0, "b": 50.0, "d": 10.0}}
+        self.assertEqual(
+            suite.compare(results, baseline, threshold=0.1),
+            [("a", 95.0, 100.0, 0.95, False),
+             ("b", 50.0, 100.0, 0.5, True)])
@@ -5,8 +5,10 @@ import os
 import string
 from itertools import product
 from tempfile import mkdtemp
+from threading import Thread
 
 from descriptors import Validated, _all_descriptors
+from descriptors.massproduced import create_init
 from descriptors.builtin_types import builtins, builtins_camel
 globals().update(_all_descriptors)
 
@@ -113,6 +115,37 @@ class DescriptorsTest(unittest.TestCase):
             with self.assertRaises(TypeError):
                 make_obj(In(val))
 
+    def test_in_index(self):
+        codes = ["C{:05d}".format(i) for i in range(1000)]
+        desc = In(codes)
+        self.assertEqual(desc.members, frozenset(codes))
+        a = make_obj(desc)
+        self.set_assert(a, "C00999")
+        self.try_set(a, "C01000")
+        self.try_set(a, ["C00001"])
+        a = make_obj(In([1, "a", [2, 3], [1], {"k": 1}]))
+        for value in (1, 1.0, True, "a", [1], [2, 3], {"k": 1}):
+            self.set_assert(a, value)
+        for value in (2, "b", [2], {"k": 2}, set([1])):
+            self.try_set(a, value)
+        # sets are only partially ordered, so they aren't bisected
+        a = make_obj(In([set([3]), set([1]), set([2])]))
+        self.set_assert(a, set([1]))
+        self.try_set(a, set([1, 2]))
+        a = make_obj(In([[set([3])], [set([1])], [set([2])]]))
+        self.set_assert(a, [set([1])])
+        self.try_set(a, [set([4])])
+        desc = In([[3], [1], [2, 2]])
+        self.assertTrue(desc.rest_sorted)
+        a = make_obj(desc)
+        self.set_assert(a, [2, 2])
+        self.try_set(a, [set([1])])
+        a = make_obj(In(range(10, 1000, 3)))
+        for value in (10, 13, 997, 13.0, True and 10):
+            self.set_assert(a, value)
+        for value in (11, 1000, 13.5, float("nan"), float("inf"), "13"):
+            self.try_set(a, value)
+
     def test_apply(self):
         a = make_obj(Apply(str.lower))
         a.f = s = str("SomE StRinG")
@@ -194,6 +227,30 @@ class DescriptorsTest(unittest.TestCase):
         self.valid_to_do.discard(desc_cls(a))
         self.invalid_to_do.discard(desc_cls(a))
 
+    def test_create_init_cached(self):
+        self.assertTrue(create_init(["regex"]) is RegexMatch._init)
+        self.assertTrue(create_init(["regex"]) is NotRegexMatch._init)
+        self.assertTrue(GreaterThan.__init__ is LessThan.__init__)
+
+    def test_concurrent_init(self):
+        results = []
+
+        def construct(i):
+            for _ in range(200):
+                desc = In(set([i])) if i % 2 else RegexMatch(str(i))
+                results.append((i, desc))
+
+        threads = [Thread(target=construct, args=(i, )) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for i, desc in results:
+            if i % 2:
+                self.assertEqual(desc.valid_values, set([i]))
+            else:
+                self.assertEqual(desc.regex, str(i))
+
     def test_delete(self):
         a = make_obj(Str())
         a.f = str("test")
@@ -0,0 +1,48 @@
+from __future__ import print_function, unicode_literals, division
+
+import subprocess
+import sys
+import unittest
+
+import descriptors
+import descriptors.massproduced as mm
+
+
+class ImportTest(unittest.TestCase):
+
+    def test_lazy_imports(self):
+        # modules that are slow to import and only needed by some
+        # features must not be imported by "import descriptors"
+        code = (
+            "import sys, descriptors, descriptors.massproduced as mm; "
+            "print(sorted(m for m in sys.modules if m in ("
+            "'numpy', 'multiprocessing', 'concurrent.futures', 'asyncio', "
+            "'inspect', 'descriptors.docstrings'))); "
+            "print(sorted(set(vars(mm)) & set(mm.funcs_by_name)))")
+        output = subprocess.check_output(
+            [sys.executable, "-c", code], universal_newlines=True)
+        self.assertEqual(output.split("\n")[:2], ["[]", "[]"])
+
+    def test_lazy_classes(self):
+        self.assertTrue(descriptors.InRange is mm.InRange)
+        self.assertTrue(issubclass(mm.Positive, descriptors.Descriptor))
+        self.assertTrue(mm.Int.__doc__)
+        self.assertTrue("Positive" in dir(mm) and "Int" in dir(descriptors))
+        with self.assertRaises(AttributeError):
+            mm.NoSuchDescriptor
+        with self.assertRaises(AttributeError):
+            descriptors.NoSuchDescriptor
+        namespace = {}
+        exec("from descriptors import *", namespace)
+        for name, cls in descriptors._all_descriptors:
+            self.assertTrue(namespace[name] is cls)
+        self.assertEqual(
+            set(name for name, _ in descriptors._all_descriptors),
+            set(mm.funcs_by_name) | set(descriptors._handmade))
+
+
+def main():
+    unittest.main()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+from __future__ import print_function, unicode_literals, division
+
+import unittest
+
+import descriptors
+from descriptors import Validated, Int, Str, Positive, Satisfies
+
+
+class A(Validated):
+    f = Int() & Positive()
+    g = Str()
+
+
+class ProfilingTest(unittest.TestCase):
+
+    def tearDown(self):
+        descriptors.disable_stats()
+        descriptors.reset_stats()
+
+    def test_stats(self):
+        setters = dict(
+            (cls, cls.__dict__["__set__"]) for cls in (Int, Str, Positive))
+        descriptors.enable_stats()
+
+        # slot variants and classes created while profiling is enabled
+        # are profiled as well
+        class B(Validated):
+            use_slots = True
+            h = Satisfies(lambda x: x % 2)
+
+        a, b = A(), B()
+        for i in range(10):
+            a.f = i + 1
+            a.g = "seven"
+            b.h = 2 * i + 1
+        for value in (0, -1):
+            with self.assertRaises(ValueError):
+                a.f = value
+        with self.assertRaises(ValueError):
+            b.h = 2
+        stats = descriptors.stats()
+        self.assertEqual(set(stats), set(["A.f", "A.g", "B.h"]))
+        self.assertEqual(stats["A.f"][:2], (12, 2))
+        self.assertEqual(stats["A.g"][:2], (10, 0))
+        self.assertEqual(stats["B.h"][:2], (11, 1))
+        s = stats["A.f"]
+        self.assertTrue(0 < s.p50 <= s.p90 <= s.p99 <= s.total)
+        self.assertAlmostEqual(s.mean, s.total / 12)
+        by_descriptor = descriptors.stats(by="descriptor")
+        self.assertEqual(by_descriptor["Int_AND_Positive"].calls, 12)
+        self.assertEqual(by_descriptor["Str"].calls, 10)
+
+        descriptors.disable_stats()
+        for cls, setter in setters.items():
+            self.assertTrue(cls.__dict__["__set__"] is setter)
+        a.f = 7
+        self.assertEqual(descriptors.stats()["A.f"].calls, 12)
+        descriptors.reset_stats()
+        self.assertEqual(descriptors.stats(), {})
+        with self.assertRaises(ValueError):
+            descriptors.stats(by="class")
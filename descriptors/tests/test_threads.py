@@ -0,0 +1,133 @@
+from __future__ import print_function, unicode_literals, division
+
+import copy
+import threading
+import unittest
+
+from descriptors import (
+    Validated, ValidationError, ValidationErrors, Memoized, Int, Str,
+    Float, Positive, InRange, MaxLength, RegexMatch, NotRegexMatch, Apply,
+    In, Satisfies)
+
+n_threads = 32
+n_rows = 150
+
+
+class Shared(Validated):
+    f = Int() & Positive() | Float() & InRange(0, 1)
+    g = Str() & MaxLength(8) & NotRegexMatch("x") & NotRegexMatch("y")
+    h = Apply(int).memoize(maxsize=64)
+    i = In(list(range(0, 1000, 2)))
+
+
+class SharedSlots(Shared):
+    use_slots = True
+    j = RegexMatch(r"^\d+$") | Int()
+
+
+class SharedCompiled(SharedSlots):
+    compile_schema = True
+
+
+class SharedFastReads(Validated):
+    fast_reads = True
+    f = Int() & Positive()
+    g = Str() | Int()
+
+
+def descriptor_state(cls):
+    state = {}
+    for name, desc in cls._fields.items():
+        attrs = dict(desc.__dict__)
+        if isinstance(desc, Memoized):
+            for attr in ("cache", "lock", "hits", "misses", "evictions"):
+                attrs.pop(attr)
+        state[name] = (desc.__class__, copy.copy(attrs))
+    return state
+
+
+class ThreadsTest(unittest.TestCase):
+
+    def run_threads(self, target):
+        failures = []
+        start = threading.Barrier(n_threads)
+
+        def run(t):
+            try:
+                start.wait()
+                target(t)
+            except Exception as e:  # reported in the main thread
+                failures.append(str(e))
+        threads = [
+            threading.Thread(target=run, args=(t, ))
+            for t in range(n_threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(failures, [])
+
+    def test_shared_descriptors(self):
+        classes = [Shared, SharedSlots, SharedCompiled, SharedFastReads]
+        before = [descriptor_state(cls) for cls in classes]
+
+        def validate(t):
+            for i in range(1, n_rows):
+                value = t * n_rows + i
+                row = {"f": value, "g": str(value), "h": str(i % 100),
+                       "i": value % 1000 // 2 * 2, "j": str(value)}
+                for cls in classes:
+                    fields = dict((k, row[k]) for k in cls._fields)
+                    obj = cls.from_dict(fields)
+                    for name in fields:
+                        expected = int(row[name]) if name == "h" else \
+                            row[name]
+                        assert getattr(obj, name) == expected
+                    obj.f = value + 1
+                    try:
+                        obj.f = -value
+                    except ValidationError as e:
+                        assert e.name == "f" and e.value == -value
+                    else:
+                        raise AssertionError("accepted {}".format(-value))
+                    try:
+                        cls.from_dict({"f": "x", "g": "x{}".format(t)})
+                    except ValidationErrors as e:
+                        names = [error.name for error in e.errors]
+                        assert names == (
+                            ["f"] if cls is SharedFastReads else ["f", "g"])
+        self.run_threads(validate)
+        self.assertEqual(
+            [descriptor_state(cls) for cls in classes], before)
+        info = Shared.h.cache_info()
+        self.assertEqual(info.currsize, 64)
+        self.assertEqual(
+            info.hits + info.misses,
+            n_threads * (n_rows - 1) * 3)
+
+    def test_sampled_descriptor(self):
+        class Sampled(Validated):
+            f = Satisfies(lambda x: x % 2).sample(0.3)
+
+        state = dict(Sampled.f.__dict__)
+        failures = []
+
+        def assign(t):
+            obj = Sampled()
+            for i in range(n_rows):
+                try:
+                    obj.f = 2
+                except ValidationError:
+                    failures.append(i)
+        self.run_threads(assign)
+        # 30% of the assignments of all threads together are checked,
+        # without changing the descriptor
+        self.assertEqual(len(failures), n_threads * n_rows * 3 // 10)
+        self.assertEqual(Sampled.f.__dict__, state)
+
+
+def main():
+    unittest.main()
+
+if __name__ == "__main__":
+    main()
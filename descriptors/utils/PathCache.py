@@ -0,0 +1,188 @@
+# descriptors.utils.PathCache
+#
+# Implements a cache of path existence checks that can be shared by
+# the path descriptors to avoid repeated stat calls.
+
+from __future__ import print_function, unicode_literals, division
+
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from descriptors.utils.parallel import thread_pool
+
+try:
+    clock = time.monotonic
+except AttributeError:  # Python 2
+    clock = time.time
+
+
+def exists_by_scanning(paths):
+    """Return a dict mapping each of paths to True if it exists and
+    to False otherwise, like os.path.exists(). Instead of calling stat
+    for every path, the paths are grouped by parent directory and each
+    directory is listed once, which is much faster for many paths in
+    few directories, especially on network filesystems.
+
+    Paths whose existence can't be decided from the directory listing
+    alone, like symbolic links, paths with a trailing separator or
+    ending in "." or "..", and paths in directories that can't be
+    listed, are checked with os.path.exists(). Names are compared
+    exactly, so on case-insensitive filesystems a path only exists if
+    its case matches.
+
+    """
+    results = {}
+    by_parent = {}
+    for path in set(paths):
+        parent, name = os.path.split(path)
+        if name in ("", os.curdir, os.pardir):
+            results[path] = os.path.exists(path)
+        else:
+            by_parent.setdefault(parent, []).append((path, name))
+    for parent, children in by_parent.items():
+        if len(children) == 1:  # a single stat beats listing the parent
+            path, _ = children[0]
+            results[path] = os.path.exists(path)
+            continue
+        try:
+            entries = list_dir(parent or os.curdir)
+        except OSError:
+            if os.path.isdir(parent or os.curdir):  # e.g. no permission
+                entries = None
+            else:
+                entries = {}
+        for path, name in children:
+            if entries is None or entries.get(name):
+                results[path] = os.path.exists(path)
+            else:
+                results[path] = name in entries
+    return results
+
+
+def exists_concurrently(paths, workers=16):
+    """Return a dict mapping each of paths to True if it exists and
+    to False otherwise, calling os.path.exists() for up to workers
+    paths at once in a thread pool. Since stat calls release the GIL
+    and mostly wait on the filesystem, this speeds up checking paths
+    in many unrelated directories on high-latency filesystems.
+
+    """
+    paths = list(set(paths))
+    with thread_pool(workers) as executor:
+        return dict(zip(paths, executor.map(os.path.exists, paths)))
+
+
+def list_dir(path):
+    """Return a dict mapping the names in directory path to True if
+    the entry is a symbolic link and to False otherwise.
+
+    """
+    if hasattr(os, "scandir"):
+        return dict(
+            (entry.name, entry.is_symlink()) for entry in os.scandir(path))
+    return dict(
+        (name, os.path.islink(os.path.join(path, name)))
+        for name in os.listdir(path))
+
+
+def check_paths(paths, workers=None):
+    """Return exists_by_scanning(paths), or, if workers is given,
+    exists_concurrently(paths, workers).
+
+    """
+    if workers is None:
+        return exists_by_scanning(paths)
+    return exists_concurrently(paths, workers)
+
+
+class PathCache(object):
+    """A thread-safe cache for the results of os.path.exists(). It
+    holds at most maxsize paths, evicting the least recently used path
+    when full, and results older than ttl seconds are checked again.
+
+    A PathCache can be shared by any number of ExistingPath and
+    MadePath descriptors:
+
+        cache = PathCache(maxsize=1000, ttl=30)
+
+        class Job(Validated):
+            input_dir = ExistingPath(cache=cache)
+            output_dir = MadePath(cache=cache)
+
+    """
+    def __init__(self, maxsize=1024, ttl=60.0):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.entries = OrderedDict()  # path -> (exists, time checked)
+        self.lock = threading.Lock()
+
+    def exists(self, path):
+        """Return os.path.exists(path), using the cached result if it
+        is younger than ttl seconds.
+
+        """
+        now = clock()
+        with self.lock:
+            entry = self.entries.pop(path, None)
+            if entry is not None and now - entry[1] < self.ttl:
+                self.entries[path] = entry
+                return entry[0]
+        exists = os.path.exists(path)
+        self.store(path, exists, now)
+        return exists
+
+    def prefetch(self, paths, workers=None):
+        """Check whether each of paths exists with one directory
+        listing per parent directory, see exists_by_scanning(), or, if
+        workers is given, with that many concurrent stat calls, see
+        exists_concurrently(), and cache the results.
+
+        """
+        now = clock()
+        results = check_paths(paths, workers)
+        for path, exists in results.items():
+            self.store(path, exists, now)
+        return results
+
+    def mark_existing(self, path):
+        """Remember that path exists, e.g. because it was just
+        created.
+
+        """
+        self.store(path, True, clock())
+
+    def store(self, path, exists, checked):
+        with self.lock:
+            self.entries.pop(path, None)
+            self.entries[path] = (exists, checked)
+            if len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def invalidate(self, path=None):
+        """Forget the cached result for path, or for all paths if path
+        is None.
+
+        """
+        with self.lock:
+            if path is None:
+                self.entries.clear()
+            else:
+                self.entries.pop(path, None)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __reduce__(self):
+        # the cached results are not pickled, since they may not hold
+        # where the cache is unpickled, e.g. in another process
+        if self is default_path_cache:
+            return "default_path_cache"
+        return (self.__class__, (self.maxsize, self.ttl))
+
+
+# The cache used by path descriptors created with cache=True
+default_path_cache = PathCache()
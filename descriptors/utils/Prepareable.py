@@ -4,11 +4,13 @@
 """
 
 import sys
-import inspect
 from functools import wraps
 
 import six
 
+if not six.PY3:
+    import inspect
+
 
 class Prepareable(type):
     if not six.PY3:
@@ -0,0 +1,114 @@
+# descriptors.utils.RegexSet
+#
+# Implements a process-wide cache of compiled regular expressions and
+# a set of regular expressions that are searched for together.
+
+from __future__ import print_function, unicode_literals, division
+
+import re
+
+import six
+
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
+# (regex, flags) -> compiled pattern, shared by all descriptors
+_patterns = {}
+_max_patterns = 4096
+
+
+def compile_pattern(regex, flags=0):
+    """Return re.compile(regex, flags), compiling every distinct regex
+    only once per process.
+
+    """
+    key = (regex, flags)
+    try:
+        return _patterns[key]
+    except KeyError:
+        pass
+    if len(_patterns) >= _max_patterns:
+        _patterns.clear()
+    return _patterns.setdefault(key, re.compile(regex, flags))
+
+
+def required_literal(pattern):
+    """Return the longest string that every match of the compiled
+    pattern contains, or None if there is none that can be found
+    easily.
+
+    """
+    if pattern.flags & re.IGNORECASE or not isinstance(
+            pattern.pattern, type("")):
+        return None
+    try:
+        parsed = sre_parse.parse(pattern.pattern, pattern.flags)
+    except Exception:  # the parser is private, so don't rely on it
+        return None
+    longest = run = ""
+    for op, arg in parsed:
+        if op is sre_parse.LITERAL:
+            run += six.unichr(arg)
+            if len(run) > len(longest):
+                longest = run
+        else:
+            run = ""
+    return longest or None
+
+
+class RegexSet(object):
+    """A set of regular expressions that are searched for in a string
+    together:
+
+        regexes = RegexSet([r"^ERROR", r"Traceback", r"\\bfailed\\b"])
+        regexes.search("job 12 failed")
+        -> 2
+
+    A regular expression is only searched for if the string contains
+    the literal text every match requires, if any. The substring test
+    is much cheaper than running the regular expression engine, so
+    searching for many regular expressions in a string that matches
+    few of them, the common case when parsing logs, is fast.
+
+    """
+    def __init__(self, regexes):
+        self.patterns = [
+            compile_pattern(regex) if isinstance(regex, type("")) else
+            compile_pattern(regex.pattern, regex.flags)
+            for regex in regexes]
+        self.literals = [
+            required_literal(pattern) for pattern in self.patterns]
+        self.checks = list(enumerate(zip(self.literals, self.patterns)))
+
+    def search(self, string):
+        """Return the index of the first regular expression that
+        matches somewhere in string, or None if none matches.
+
+        """
+        if string.__class__ is not type(""):  # literals only suit str
+            for i, pattern in enumerate(self.patterns):
+                if pattern.search(string):
+                    return i
+            return None
+        for i, (literal, pattern) in self.checks:
+            if literal is not None and literal not in string:
+                continue
+            if pattern.search(string):
+                return i
+        return None
+
+    def matches(self, string):
+        """Return the indices of all regular expressions that match
+        somewhere in string.
+
+        """
+        prefilter = string.__class__ is type("")
+        return [
+            i for i, (literal, pattern) in self.checks
+            if (literal is None or not prefilter or literal in string)
+            and pattern.search(string)]
+
+    def __len__(self):
+        return len(self.patterns)
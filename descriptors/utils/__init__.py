@@ -1 +1,3 @@
 from descriptors.utils.Prepareable import Prepareable
+from descriptors.utils.PathCache import PathCache, default_path_cache
+from descriptors.utils.RegexSet import RegexSet, compile_pattern
@@ -0,0 +1,49 @@
+# descriptors.utils.parallel
+#
+# Helpers for running validations concurrently.
+
+from __future__ import print_function, unicode_literals, division
+
+from collections import deque
+from itertools import islice
+
+
+def ordered_map(executor, func, iterable, window):
+    """Yield func(item) for each item in iterable, in order, computing
+    the results with executor. Unlike executor.map(), at most window
+    items are submitted ahead of the result being yielded, so
+    iterable can be a long stream.
+
+    """
+    iterator = iter(iterable)
+    pending = deque(
+        executor.submit(func, item) for item in islice(iterator, window))
+    while pending:
+        result = pending.popleft().result()
+        for item in islice(iterator, 1):
+            pending.append(executor.submit(func, item))
+        yield result
+
+
+def thread_pool(workers):
+    """Return a ThreadPoolExecutor with workers threads."""
+    from concurrent.futures import ThreadPoolExecutor
+    return ThreadPoolExecutor(max_workers=workers)
+
+
+def process_pool(workers):
+    """Return a ProcessPoolExecutor with workers processes."""
+    from concurrent.futures import ProcessPoolExecutor
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+def chunked(iterable, size):
+    """Yield lists of size consecutive items of iterable. The last
+    list holds the remaining items and may be shorter.
+
+    """
+    iterator = iter(iterable)
+    chunk = list(islice(iterator, size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, size))
@@ -5,7 +5,7 @@ version = '0.1.0'
 author = 'Benjamin Heinzerling'
 email = 'benjamin.heinzerling@openmailbox.org'
 description = 'A collection of descriptors for validating input data.'
-packages = ['descriptors']
+packages = ['descriptors', 'descriptors.utils', 'descriptors.bench']
 scripts = []
 classifiers = [
     "Development Status :: 4 - Beta",